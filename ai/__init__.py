@@ -1,5 +1,9 @@
 """AI Provider module for LinkedIn Assistant Bot"""
 
+import hashlib
+import json
+import os
+
 from .base import AIProvider
 
 __all__ = [
@@ -7,10 +11,20 @@ __all__ = [
     'get_ai_provider'
 ]
 
-def get_ai_provider(config: dict) -> AIProvider:
-    """Factory function to get the appropriate AI provider based on config"""
-    provider_name = config.get('ai_provider', 'openai').lower()
+# Config section and API key environment variable for each provider
+_CONFIG_SECTIONS = {'local': 'local_llm'}
+_API_KEY_ENV_VARS = {
+    'openai': 'OPENAI_API_KEY',
+    'anthropic': 'ANTHROPIC_API_KEY',
+    'gemini': 'GOOGLE_API_KEY'
+}
 
+# Provider instances reused across calls, keyed by provider, settings and API key hash
+_providers = {}
+
+
+def _create_ai_provider(provider_name: str, config: dict) -> AIProvider:
+    """Instantiate a provider by name"""
     # Lazy imports - only import when needed
     if provider_name == 'openai':
         from .openai_provider import OpenAIProvider
@@ -26,3 +40,24 @@ def get_ai_provider(config: dict) -> AIProvider:
         return LocalLLMProvider(config)
     else:
         raise ValueError(f"Unknown AI provider: {provider_name}. Choose from: openai, anthropic, gemini, local")
+
+
+def get_ai_provider(config: dict) -> AIProvider:
+    """Factory function to get the appropriate AI provider based on config
+
+    Providers are cached per process, so repeated calls with the same provider
+    settings and API key reuse the existing client instead of rebuilding it.
+    """
+    provider_name = config.get('ai_provider', 'openai').lower()
+
+    provider_settings = config.get(_CONFIG_SECTIONS.get(provider_name, provider_name), {})
+    env_var = _API_KEY_ENV_VARS.get(provider_name)
+    api_key = os.getenv(env_var, '') if env_var else ''
+    # Hash the key so the raw secret is never held as a cache key
+    api_key_hash = hashlib.sha256(api_key.encode()).hexdigest() if api_key else ''
+
+    cache_key = (provider_name, json.dumps(provider_settings, sort_keys=True, default=str), api_key_hash)
+    provider = _providers.get(cache_key)
+    if provider is None:
+        provider = _providers[cache_key] = _create_ai_provider(provider_name, config)
+    return provider
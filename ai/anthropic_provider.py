@@ -33,7 +33,8 @@ class AnthropicProvider(AIProvider):
         length: str = "medium",
         include_emojis: bool = True,
         include_hashtags: bool = True,
-        max_hashtags: int = 5
+        max_hashtags: int = 5,
+        performance_data: Optional[Dict] = None
     ) -> Dict[str, any]:
         """Generate a LinkedIn post using Claude"""
 
@@ -51,7 +52,7 @@ Requirements:
 - Tone: {tone}
 - Length: {length_guidelines.get(length, length_guidelines['medium'])}
 - Include emojis: {'Yes' if include_emojis else 'No'}
-- Include hashtags: {'Yes, up to ' + str(max_hashtags) if include_hashtags else 'No'}
+- Include hashtags: {'Yes, up to ' + str(max_hashtags) if include_hashtags else 'No'}{self._performance_context(performance_data)}
 
 The post should:
 1. Start with a strong hook to grab attention
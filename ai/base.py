@@ -24,7 +24,8 @@ class AIProvider(ABC):
         length: str = "medium",
         include_emojis: bool = True,
         include_hashtags: bool = True,
-        max_hashtags: int = 5
+        max_hashtags: int = 5,
+        performance_data: Optional[Dict] = None
     ) -> Dict[str, any]:
         """
         Generate a LinkedIn post
@@ -36,12 +37,35 @@ class AIProvider(ABC):
             include_emojis: Whether to include emojis
             include_hashtags: Whether to include hashtags
             max_hashtags: Maximum number of hashtags
+            performance_data: Optional analytics from previous posts to optimize for
+                              in the same request (see _performance_context)
 
         Returns:
             Dictionary with 'content' and 'hashtags' keys
         """
         pass
 
+    def _performance_context(self, performance_data: Optional[Dict]) -> str:
+        """
+        Format past performance data as an extra prompt section for generate_post
+
+        Args:
+            performance_data: Analytics data from previous posts
+
+        Returns:
+            Prompt text (empty string when there is no data)
+        """
+        if not performance_data:
+            return ""
+
+        return f"""
+
+Optimize for what has worked before ({performance_data.get('total_posts', 'N/A')} published posts):
+- Best performing tone: {performance_data.get('optimal_tone', 'N/A')}
+- Best performing length: {performance_data.get('optimal_length', 'N/A')}
+- Top performing topics: {', '.join(performance_data.get('top_topics', []))}
+- Strengthen the hook in the first 2 lines and make the call-to-action compelling"""
+
     @abstractmethod
     def generate_comment(
         self,
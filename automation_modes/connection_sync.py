@@ -5,6 +5,7 @@ Automatically scrapes and syncs LinkedIn connections to the database.
 
 import logging
 import time
+import traceback
 from typing import Dict, List, Optional
 from datetime import datetime
 from automation_modes.base import AutomationMode
@@ -69,14 +70,16 @@ class ConnectionSyncMode(AutomationMode):
 
             print(f"\n💾 Syncing {len(connections_data)} connections to database...")
 
+            # Existing connections are looked up in one pass instead of one query per row
+            existing_by_url = self.connection_manager.get_connections_by_url(
+                conn_data.get('profile_url') for conn_data in connections_data
+            )
+
             # Sync to database
             for conn_data in connections_data:
                 try:
                     # Check if connection already exists
-                    from database.models import Connection
-                    existing = self.db_session.query(Connection).filter_by(
-                        profile_url=conn_data['profile_url']
-                    ).first()
+                    existing = existing_by_url.get(conn_data['profile_url'])
 
                     if existing:
                         # Update existing connection
@@ -95,8 +98,9 @@ class ConnectionSyncMode(AutomationMode):
                             existing.updated_at = datetime.utcnow()
                             results['connections_updated'] += 1
                     else:
-                        # Add new connection
-                        self.connection_manager.add_connection(
+                        # Stage new connection (committed below with the updates), recorded so a
+                        # repeated profile later in the scrape updates it
+                        existing_by_url[conn_data['profile_url']] = self.connection_manager.stage_connection(
                             name=conn_data['name'],
                             profile_url=conn_data['profile_url'],
                             title=conn_data.get('title'),
@@ -117,7 +121,8 @@ class ConnectionSyncMode(AutomationMode):
                     results['errors'] += 1
                     continue
 
-            # Commit changes
+            # Commit changes. New rows are only staged above, so a failure here
+            # rolls back the whole sync rather than a single connection
             self.db_session.commit()
 
             results['success'] = True
@@ -134,10 +139,10 @@ class ConnectionSyncMode(AutomationMode):
             )
 
         except Exception as e:
+            self.db_session.rollback()
             self.logger.error(f"Connection sync failed: {e}")
             results['error'] = str(e)
             results['success'] = False
-            import traceback
             traceback.print_exc()
 
         return results
@@ -35,7 +35,8 @@ class Database:
         self.engine = create_engine(
             self.connection_string,
             echo=False,  # Set to True for SQL query logging
-            pool_pre_ping=True  # Verify connections before using
+            pool_pre_ping=True,  # Verify connections before using
+            pool_recycle=1800  # Replace pooled connections older than 30 minutes
         )
 
         # Create session factory
@@ -1,8 +1,9 @@
 """Database Models for LinkedIn Assistant Bot"""
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Boolean, ForeignKey, Index, JSON, func
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 
 Base = declarative_base()
@@ -11,6 +12,12 @@ Base = declarative_base()
 class Post(Base):
     """Model for LinkedIn posts"""
     __tablename__ = 'posts'
+    __table_args__ = (
+        # Serves due/next scheduled post lookups (scheduled, unpublished, by time)
+        Index('idx_posts_due', 'is_scheduled', 'published', 'scheduled_time'),
+        # Serves content analysis over a recent date range
+        Index('idx_posts_created_at', 'created_at'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     content = Column(Text, nullable=False)
@@ -145,6 +152,10 @@ class Activity(Base):
 class Connection(Base):
     """Model for LinkedIn connections"""
     __tablename__ = 'connections'
+    __table_args__ = (
+        # Serves ConnectionManager.get_top_connections (active filter + quality ordering)
+        Index('idx_connections_top', 'is_active', 'quality_score', 'messages_sent', 'messages_received'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
@@ -179,6 +190,15 @@ class Connection(Base):
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     last_interaction = Column(DateTime)
 
+    @hybrid_property
+    def total_messages(self):
+        """Messages exchanged in both directions"""
+        return (self.messages_sent or 0) + (self.messages_received or 0)
+
+    @total_messages.expression
+    def total_messages(cls):
+        return func.coalesce(cls.messages_sent, 0) + func.coalesce(cls.messages_received, 0)
+
     def __repr__(self):
         return f"<Connection(id={self.id}, name='{self.name}', quality={self.quality_score})>"
 
@@ -560,8 +580,8 @@ class TestVariant(Base):
     variant_name = Column(String(50), nullable=False)  # control, variant_a, variant_b, etc.
     variant_label = Column(String(200))  # Human-readable label (e.g., "Short & Professional")
 
-    # Configuration (JSON string)
-    variant_config = Column(Text)  # JSON with variant settings (tone, length, emoji, etc.)
+    # Configuration (decoded by the column type, existing JSON text rows read as-is)
+    variant_config = Column(JSON)  # Variant settings (tone, length, emoji, etc.)
 
     # Sample tracking
     posts_count = Column(Integer, default=0)  # Number of posts in this variant
@@ -661,6 +681,12 @@ class TestAssignment(Base):
 class HashtagPerformance(Base):
     """Model for tracking hashtag performance across posts"""
     __tablename__ = 'hashtag_performance'
+    __table_args__ = (
+        # Hashtags recorded for a post
+        Index('idx_hashtag_performance_post_id', 'post_id'),
+        # Per-hashtag history over a date range (equality on hashtag, range on time)
+        Index('idx_hashtag_perf_hashtag_time', 'hashtag', 'recorded_at'),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
 
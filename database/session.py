@@ -1,12 +1,55 @@
 """Database session helper for LinkedIn Assistant Bot"""
 
-import yaml
+from contextlib import contextmanager
 from pathlib import Path
 from database.db import Database
 
 # Global database instance
 _db_instance = None
 
+# Shared Database instances keyed by (type, path) so the engine and its
+# connection pool are built once per process
+_databases = {}
+
+
+def get_database(config: dict) -> Database:
+    """
+    Get the shared Database for a configuration, creating it on first use.
+
+    Args:
+        config: Configuration dictionary from config.yaml
+
+    Returns:
+        Database instance
+    """
+    db_config = config.get('database', {})
+    key = (db_config.get('type', 'sqlite'), db_config.get('path', 'linkedin_assistant.db'))
+
+    db = _databases.get(key)
+    if db is None:
+        db = _databases[key] = Database(config)
+    return db
+
+
+@contextmanager
+def db_session(config: dict):
+    """
+    Context manager yielding a session from the shared Database.
+
+    The session is closed on exit, including when the body raises.
+
+    Args:
+        config: Configuration dictionary from config.yaml
+
+    Yields:
+        SQLAlchemy session
+    """
+    session = get_database(config).get_session()
+    try:
+        yield session
+    finally:
+        session.close()
+
 
 def get_session():
     """
@@ -18,12 +61,14 @@ def get_session():
     global _db_instance
 
     if _db_instance is None:
+        # Imported here: the utils package imports this module via the scheduler
+        from utils.config_loader import load_config
+
         # Load config
         config_path = Path(__file__).parent.parent / 'config.yaml'
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = load_config(config_path)
 
         # Initialize database
-        _db_instance = Database(config)
+        _db_instance = get_database(config)
 
     return _db_instance.get_session()
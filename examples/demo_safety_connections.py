@@ -172,8 +172,7 @@ def main():
     print(f"\n🏆 Top 5 Connections by Quality:")
     top_conns = conn_manager.get_top_connections(limit=5)
     for i, conn in enumerate(top_conns, 1):
-        total_messages = conn.messages_sent + conn.messages_received
-        print(f"  {i}. {conn.name:25} | Quality: {conn.quality_score:.1f}/10 | Messages: {total_messages}")
+        print(f"  {i}. {conn.name:25} | Quality: {conn.quality_score:.1f}/10 | Messages: {conn.total_messages}")
 
     # Top companies
     if analytics['top_companies']:
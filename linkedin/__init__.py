@@ -1,9 +1,6 @@
 """LinkedIn automation module for LinkedIn Assistant Bot"""
 
-from .client import LinkedInClient
-from .post_manager import PostManager
-from .engagement_manager import EngagementManager
-from .connection_manager import ConnectionManager
+import importlib
 
 __all__ = [
     'LinkedInClient',
@@ -11,3 +8,18 @@ __all__ = [
     'EngagementManager',
     'ConnectionManager'
 ]
+
+# Submodule defining each exported name. Imported on first access so that
+# e.g. linkedin.connection_manager can be used without loading Selenium.
+_EXPORTS = {
+    'LinkedInClient': '.client',
+    'PostManager': '.post_manager',
+    'EngagementManager': '.engagement_manager',
+    'ConnectionManager': '.connection_manager'
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
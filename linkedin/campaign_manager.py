@@ -3,8 +3,8 @@
 import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_, or_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import desc, and_, or_, func, case
 
 from database.models import Campaign, CampaignTarget, CampaignActivity, Activity, Connection
 from utils.safety_monitor import SafetyMonitor
@@ -217,12 +217,13 @@ class CampaignManager:
 
         return campaign_activity
 
-    def get_campaign_analytics(self, campaign_id: int) -> Dict:
+    def get_campaign_analytics(self, campaign_id: int, top_n: int = 10) -> Dict:
         """
         Get comprehensive analytics for a campaign
 
         Args:
             campaign_id: Campaign ID
+            top_n: Number of top engaged authors to include
 
         Returns:
             Dictionary with campaign analytics
@@ -231,35 +232,40 @@ class CampaignManager:
         if not campaign:
             return {}
 
-        # Get all activities
-        activities = self.db.query(CampaignActivity).filter(
-            CampaignActivity.campaign_id == campaign_id
-        ).all()
-
-        # Calculate metrics
-        total_activities = len(activities)
-        successful_activities = sum(1 for a in activities if a.success)
-        failed_activities = total_activities - successful_activities
+        success_count = func.sum(case((CampaignActivity.success == True, 1), else_=0))
 
         # Activities by type
-        activities_by_type = {}
-        for activity in activities:
-            action = activity.action_type
-            activities_by_type[action] = activities_by_type.get(action, 0) + 1
+        activities_by_type = dict(self.db.query(
+            CampaignActivity.action_type, func.count(CampaignActivity.id)
+        ).filter(
+            CampaignActivity.campaign_id == campaign_id
+        ).group_by(CampaignActivity.action_type).all())
 
-        # Activities by target
+        # Activities and successes by matched target
+        target_stats = {}
         activities_by_target = {}
-        for activity in activities:
-            target = activity.matched_target or 'unknown'
-            activities_by_target[target] = activities_by_target.get(target, 0) + 1
+        for matched_target, count, successes in self.db.query(
+            CampaignActivity.matched_target, func.count(CampaignActivity.id), success_count
+        ).filter(
+            CampaignActivity.campaign_id == campaign_id
+        ).group_by(CampaignActivity.matched_target):
+            target_stats[matched_target] = (count, successes or 0)
+            target = matched_target or 'unknown'
+            activities_by_target[target] = activities_by_target.get(target, 0) + count
 
-        # Top authors engaged
-        author_engagement = {}
-        for activity in activities:
-            if activity.target_author:
-                author_engagement[activity.target_author] = author_engagement.get(activity.target_author, 0) + 1
+        # Calculate metrics
+        total_activities = sum(count for count, _ in target_stats.values())
+        successful_activities = sum(successes for _, successes in target_stats.values())
+        failed_activities = total_activities - successful_activities
 
-        top_authors = sorted(author_engagement.items(), key=lambda x: x[1], reverse=True)[:10]
+        # Top authors engaged
+        top_authors = self.db.query(
+            CampaignActivity.target_author, func.count(CampaignActivity.id).label('count')
+        ).filter(
+            CampaignActivity.campaign_id == campaign_id,
+            CampaignActivity.target_author.isnot(None),
+            CampaignActivity.target_author != ''
+        ).group_by(CampaignActivity.target_author).order_by(desc('count')).limit(top_n).all()
 
         # Timeline data (activities per day)
         if campaign.start_date:
@@ -281,13 +287,13 @@ class CampaignManager:
 
         target_performance = []
         for target in targets:
-            target_activities = [a for a in activities if a.matched_target == target.target_value]
+            engagements, successes = target_stats.get(target.target_value, (0, 0))
             target_performance.append({
                 'type': target.target_type,
                 'value': target.target_value,
                 'priority': target.priority,
-                'engagements': len(target_activities),
-                'success_rate': (sum(1 for a in target_activities if a.success) / len(target_activities) * 100) if target_activities else 0
+                'engagements': engagements,
+                'success_rate': (successes / engagements * 100) if engagements else 0
             })
 
         return {
@@ -322,9 +328,20 @@ class CampaignManager:
             'last_executed': campaign.last_executed
         }
 
-    def get_active_campaigns(self) -> List[Campaign]:
-        """Get all active campaigns"""
-        return self.db.query(Campaign).filter(Campaign.status == 'active').all()
+    def get_active_campaigns(self, with_targets: bool = False) -> List[Campaign]:
+        """
+        Get all active campaigns
+
+        Args:
+            with_targets: Load every campaign's targets up front in one extra query
+
+        Returns:
+            List of active campaigns
+        """
+        query = self.db.query(Campaign).filter(Campaign.status == 'active')
+        if with_targets:
+            query = query.options(selectinload(Campaign.targets))
+        return query.all()
 
     def check_campaign_limits(self, campaign_id: int) -> Dict:
         """
@@ -13,6 +13,8 @@ from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 
+INVITATION_MANAGER_URL = "https://www.linkedin.com/mynetwork/invitation-manager/"
+
 
 class LinkedInClient:
     """Handles browser automation and session management for LinkedIn"""
@@ -375,7 +377,7 @@ class LinkedInClient:
 
         try:
             # Navigate to My Network page (where pending requests are shown)
-            self.driver.get("https://www.linkedin.com/mynetwork/invitation-manager/")
+            self.driver.get(INVITATION_MANAGER_URL)
             time.sleep(3)
 
             requests = []
@@ -453,6 +455,16 @@ class LinkedInClient:
             print(f"Error getting incoming requests: {e}")
             return []
 
+    def _open_invitation_manager(self):
+        """Navigate to the invitation manager unless the browser is already there
+
+        Lets a batch of accept/decline calls after get_incoming_connection_requests
+        work on the loaded page instead of reloading it for every request.
+        """
+        if not self.driver.current_url.startswith(INVITATION_MANAGER_URL):
+            self.driver.get(INVITATION_MANAGER_URL)
+            time.sleep(3)
+
     def accept_connection_request(self, request_id: str) -> bool:
         """
         Accept an incoming connection request
@@ -467,9 +479,7 @@ class LinkedInClient:
             raise Exception("Must be logged in to accept connections")
 
         try:
-            # Navigate to invitation manager
-            self.driver.get("https://www.linkedin.com/mynetwork/invitation-manager/")
-            time.sleep(3)
+            self._open_invitation_manager()
 
             # Find the invitation card for this profile
             try:
@@ -506,9 +516,7 @@ class LinkedInClient:
             raise Exception("Must be logged in to decline connections")
 
         try:
-            # Navigate to invitation manager
-            self.driver.get("https://www.linkedin.com/mynetwork/invitation-manager/")
-            time.sleep(3)
+            self._open_invitation_manager()
 
             try:
                 # Find Ignore/Decline button
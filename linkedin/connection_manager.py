@@ -4,9 +4,9 @@ Manages LinkedIn connections, tracks engagement, and scores connection quality.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, case
 from database.models import Connection, Activity
 
 
@@ -57,18 +57,14 @@ class ConnectionManager:
             return existing
 
         # Create new connection
-        connection = Connection(
+        connection = self.stage_connection(
             name=name,
             profile_url=profile_url,
             title=title,
             company=company,
             location=location,
-            connection_date=datetime.utcnow(),
-            connection_source=connection_source,
-            is_active=True
+            connection_source=connection_source
         )
-
-        self.db.add(connection)
         self.db.commit()
 
         # Calculate initial quality score
@@ -76,6 +72,35 @@ class ConnectionManager:
 
         return connection
 
+    def stage_connection(self, name: str, profile_url: str,
+                         title: str = None, company: str = None,
+                         location: str = None, connection_source: str = "manual") -> Connection:
+        """Add a new connection to the session without committing
+
+        For bulk syncs that commit once at the end. Unlike add_connection,
+        this does not check for an existing row with the same profile URL.
+        A new connection has no engagement yet, so it starts with a zero
+        quality score.
+
+        Returns:
+            The pending Connection object
+        """
+        connection = Connection(
+            name=name,
+            profile_url=profile_url,
+            title=title,
+            company=company,
+            location=location,
+            connection_date=datetime.utcnow(),
+            connection_source=connection_source,
+            is_active=True,
+            quality_score=0.0,
+            engagement_level='none'
+        )
+
+        self.db.add(connection)
+        return connection
+
     def update_engagement(self, profile_url: str,
                          messages_sent: int = 0,
                          messages_received: int = 0,
@@ -151,11 +176,37 @@ class ConnectionManager:
             Connection.profile_url == profile_url
         ).first()
 
-    def get_all_connections(self, active_only: bool = True) -> List[Connection]:
+    def get_connections_by_url(self, profile_urls: Iterable[str],
+                               chunk_size: int = 500) -> Dict[str, Connection]:
+        """Get the connections for many profile URLs at once
+
+        One query per chunk_size URLs, instead of one lookup per URL.
+
+        Args:
+            profile_urls: LinkedIn profile URLs to look up
+            chunk_size: URLs per query (keeps the IN list bounded)
+
+        Returns:
+            Dictionary mapping profile URL to Connection; unknown URLs are absent
+        """
+        urls = list({url for url in profile_urls if url})
+
+        connections = {}
+        for start in range(0, len(urls), chunk_size):
+            rows = self.db.query(Connection).filter(
+                Connection.profile_url.in_(urls[start:start + chunk_size])
+            ).all()
+            connections.update((connection.profile_url, connection) for connection in rows)
+
+        return connections
+
+    def get_all_connections(self, active_only: bool = True,
+                            limit: Optional[int] = None) -> List[Connection]:
         """Get all connections
 
         Args:
             active_only: Only return active connections
+            limit: Maximum number of connections to return (all if None)
 
         Returns:
             List of Connection objects
@@ -165,23 +216,59 @@ class ConnectionManager:
         if active_only:
             query = query.filter(Connection.is_active == True)
 
-        return query.order_by(desc(Connection.quality_score)).all()
+        query = query.order_by(desc(Connection.quality_score))
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query.all()
+
+    def count_connections(self, active_only: bool = True) -> int:
+        """Count connections without loading them
+
+        Args:
+            active_only: Only count active connections
+
+        Returns:
+            Number of connections
+        """
+        query = self.db.query(func.count(Connection.id))
+
+        if active_only:
+            query = query.filter(Connection.is_active == True)
+
+        return query.scalar()
 
     def get_top_connections(self, limit: int = 10,
-                           min_quality_score: float = 0.0) -> List[Connection]:
-        """Get top connections by quality score
+                           min_quality_score: float = 0.0) -> List:
+        """Get top connections by quality score, ties broken by total messages
+
+        Only the columns needed for ranking displays are loaded, not full
+        Connection objects.
 
         Args:
             limit: Maximum number of connections to return
             min_quality_score: Minimum quality score threshold
 
         Returns:
-            List of top Connection objects
+            List of rows with name, title, company, profile_url, quality_score,
+            messages_sent, messages_received and total_messages attributes
         """
-        return self.db.query(Connection).filter(
+        return self.db.query(
+            Connection.name,
+            Connection.title,
+            Connection.company,
+            Connection.profile_url,
+            Connection.quality_score,
+            Connection.messages_sent,
+            Connection.messages_received,
+            Connection.total_messages.label('total_messages')
+        ).filter(
             Connection.is_active == True,
             Connection.quality_score >= min_quality_score
-        ).order_by(desc(Connection.quality_score)).limit(limit).all()
+        ).order_by(
+            desc(Connection.quality_score),
+            desc(Connection.total_messages)
+        ).limit(limit).all()
 
     def mark_target_audience(self, profile_url: str, is_target: bool = True,
                             notes: str = None) -> Optional[Connection]:
@@ -329,6 +416,33 @@ class ConnectionManager:
             'total_days_tracked': int(total_days_tracked)
         }
 
+    def get_network_summary(self, days_back: int = 7) -> Dict:
+        """Get headline network numbers in a single query
+
+        A lightweight subset of get_network_analytics for frequent status displays.
+
+        Args:
+            days_back: Window for counting recent interactions
+
+        Returns:
+            Dictionary with total_connections, avg_quality_score and recent_interactions
+        """
+        cutoff_date = datetime.utcnow() - timedelta(days=days_back)
+
+        total_connections, avg_quality, recent_interactions = self.db.query(
+            func.count(Connection.id),
+            func.avg(Connection.quality_score),
+            func.count(case((Connection.last_interaction >= cutoff_date, 1)))
+        ).filter(
+            Connection.is_active == True
+        ).one()
+
+        return {
+            'total_connections': total_connections,
+            'avg_quality_score': round(avg_quality or 0.0, 2),
+            'recent_interactions': recent_interactions
+        }
+
     def get_connection_recommendations(self) -> Dict:
         """Get recommendations for improving network quality
 
@@ -1,6 +1,7 @@
 """LinkedIn Engagement Management"""
 
 import time
+import traceback
 from typing import List, Dict, Optional
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -168,7 +169,6 @@ class EngagementManager:
 
         except Exception as e:
             print(f"Error getting feed posts: {e}")
-            import traceback
             traceback.print_exc()
             return []
 
@@ -189,7 +189,11 @@ class PostManager:
                     print(f"Could not click Post button: {e2}")
                     return False
 
-            time.sleep(5)
+            # Wait for the share dialog to close rather than a fixed delay
+            try:
+                WebDriverWait(self.driver, 15, poll_frequency=0.5).until(EC.staleness_of(editor))
+            except TimeoutException:
+                print("Post dialog still open after 15s; assuming the post went through")
 
             print("✓ Post published successfully!")
             return True
@@ -11,7 +11,6 @@ from pathlib import Path
 # Add parent directory to path so we can import project modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-import yaml
 import click
 from rich.console import Console
 from rich.table import Table
@@ -20,8 +19,9 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from ai import get_ai_provider
-from database import Database
+from database.session import get_database
 from utils import SafetyMonitor
+from utils.config_loader import load_config
 from automation_modes import (
     AutomationManager,
     FeedEngagementMode,
@@ -39,20 +39,14 @@ from automation_modes import (
 console = Console()
 
 
-def load_config():
-    """Load configuration"""
-    with open('config.yaml', 'r') as f:
-        return yaml.safe_load(f)
-
-
 def init_components():
     """Initialize common components"""
     config = load_config()
     automation_config = config.get('automation_modes', {})
 
-    # Initialize database
-    db = Database(config.get('database', {}))
-    session = db.Session()
+    # Initialize database (shared engine for this process)
+    db = get_database(config)
+    session = db.get_session()
 
     # Initialize AI provider
     ai_provider = get_ai_provider(config)
@@ -15,48 +15,76 @@ Runs continuously to:
 - Track performance across all activities
 """
 
+import logging
+import signal
+import threading
 import time
-import yaml
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 import random
 from rich.console import Console
-from rich.table import Table
+from sqlalchemy import func
 
-from database.db import Database
-from database.models import Post, Comment
-from linkedin.client import LinkedInClient
-from linkedin.post_manager import PostManager
+from database.session import get_database
+from utils.config_loader import load_config
+from database.models import Post, Comment, SequenceEnrollment
 from utils.safety_monitor import SafetyMonitor
-from utils.campaign_executor import CampaignExecutor
 from utils.network_growth import NetworkGrowthAutomation
 from linkedin.connection_manager import ConnectionManager
 from linkedin.campaign_manager import CampaignManager
 
 console = Console()
+logger = logging.getLogger(__name__)
 
 
 class AutonomousAgentV2:
     """Autonomous LinkedIn agent with full safety and campaign integration"""
 
-    def __init__(self, config_path: str = 'config.yaml'):
+    # The agent is long-lived and its attributes are fixed; every attribute set
+    # on an instance must be listed here
+    __slots__ = (
+        'config', 'db', 'agent_config',
+        # Settings
+        'check_interval', 'min_check_interval', 'max_check_interval',
+        'auto_post_scheduled', 'enable_campaigns', 'enable_network_growth',
+        'max_posts_per_cycle', 'max_engagements_per_cycle',
+        'min_post_delay', 'max_post_delay',
+        'max_connection_requests_per_cycle', 'max_incoming_requests_per_cycle',
+        'process_message_sequences',
+        # LinkedIn client and managers
+        'client', 'post_manager', 'session', 'safety_monitor', 'campaign_executor',
+        'connection_manager', 'campaign_manager', 'network_growth',
+        # Tracking
+        'cycle_count', 'total_posts_published', 'total_campaign_engagements',
+        'total_connection_requests_sent', 'total_incoming_requests_processed',
+        'total_sequence_messages_sent', 'last_safety_pause', 'consecutive_errors',
+        'idle_cycles', 'next_event_time', '_wake_requested'
+    )
+
+    def __init__(self, config_path: str = 'config.yaml', config: Optional[Dict] = None):
         """
         Initialize the autonomous agent v2
 
         Args:
             config_path: Path to configuration file
+            config: Already-loaded configuration (e.g. with CLI overrides applied).
+                    When given, config_path is not read.
         """
-        with open(config_path, 'r') as f:
-            self.config = yaml.safe_load(f)
+        if config is None:
+            config = load_config(config_path)
+        self.config = config
 
-        # Initialize database
-        self.db = Database(self.config)
+        # Initialize database (shared engine and connection pool)
+        self.db = get_database(self.config)
 
         # Get autonomous agent config
         self.agent_config = self.config.get('autonomous_agent', {})
 
         # Settings
         self.check_interval = self.agent_config.get('check_interval', 300)  # 5 minutes
+        # Adaptive sleep bounds: wake early for due work, back off when idle
+        self.min_check_interval = self.agent_config.get('min_check_interval', 60)
+        self.max_check_interval = self.agent_config.get('max_check_interval', self.check_interval * 4)
         self.auto_post_scheduled = self.agent_config.get('auto_post_scheduled', True)
         self.enable_campaigns = self.agent_config.get('enable_campaigns', True)
         self.enable_network_growth = self.agent_config.get('enable_network_growth', True)
@@ -65,6 +93,10 @@ class AutonomousAgentV2:
         self.max_posts_per_cycle = self.agent_config.get('max_posts_per_cycle', 20)
         self.max_engagements_per_cycle = self.agent_config.get('max_engagements_per_cycle', 10)
 
+        # Human-like delay range between scheduled posts (seconds)
+        self.min_post_delay = self.agent_config.get('min_post_delay', 60)
+        self.max_post_delay = self.agent_config.get('max_post_delay', 180)
+
         # Network growth settings
         self.max_connection_requests_per_cycle = self.agent_config.get('max_connection_requests_per_cycle', 3)
         self.max_incoming_requests_per_cycle = self.agent_config.get('max_incoming_requests_per_cycle', 5)
@@ -74,7 +106,8 @@ class AutonomousAgentV2:
         self.client = None
         self.post_manager = None
 
-        # Managers (initialized per session)
+        # Managers (built once for the session)
+        self.session = None
         self.safety_monitor = None
         self.campaign_executor = None
         self.connection_manager = None
@@ -90,29 +123,81 @@ class AutonomousAgentV2:
         self.total_sequence_messages_sent = 0
         self.last_safety_pause = None
         self.consecutive_errors = 0
+        self.idle_cycles = 0
+        self.next_event_time = None
+
+        # Set by wake() to cut the sleep between cycles short. A plain flag rather
+        # than a threading.Event: wake() runs from the SIGUSR1 handler on the main
+        # thread, which could deadlock on the Event's lock held by that same thread
+        self._wake_requested = False
+
+    def wake(self):
+        """Interrupt the sleep between cycles so the next cycle starts now"""
+        self._wake_requested = True
+
+    def _sleep_until_woken(self, seconds: float, poll_interval: float = 1.0) -> bool:
+        """
+        Sleep for up to `seconds`, returning early once wake() has been called
+
+        Returns:
+            True if woken early, False if the full sleep elapsed
+        """
+        deadline = time.monotonic() + seconds
+        while not self._wake_requested:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, poll_interval))
+
+        woken = self._wake_requested
+        self._wake_requested = False
+        return woken
 
     def initialize_session(self):
-        """Initialize database session and managers"""
+        """
+        Get the database session, initializing managers on first use
+
+        The scoped session registry returns the same session every cycle, and
+        closing it at the end of a cycle only hands its connection back to the
+        pool, so the managers are built once and reused.
+        """
         session = self.db.get_session()
 
-        # Initialize managers
-        self.safety_monitor = SafetyMonitor(session, self.config)
-        self.campaign_manager = CampaignManager(session, self.config)
-        self.connection_manager = ConnectionManager(session, self.config)
-        self.network_growth = NetworkGrowthAutomation(session, self.config)
+        if session is not self.session:
+            self.session = session
+
+            # Initialize managers
+            self.safety_monitor = SafetyMonitor(session, self.config)
+            self.campaign_manager = CampaignManager(session, self.config)
+            self.connection_manager = ConnectionManager(session, self.config)
+            self.network_growth = NetworkGrowthAutomation(session, self.client, self.config)
 
         return session
 
-    def initialize_linkedin(self):
-        """Initialize LinkedIn client and managers"""
+    def initialize_linkedin(self) -> bool:
+        """
+        Initialize LinkedIn client and managers
+
+        Returns:
+            True if a logged-in client is available
+        """
         if self.client is None:
+            # Imported here: the Selenium stack is only needed once a cycle has LinkedIn work
+            from linkedin.client import LinkedInClient
+            from linkedin.post_manager import PostManager
+
             console.print("[cyan]Initializing LinkedIn connection...[/cyan]")
             self.client = LinkedInClient(self.config)
             self.client.start()
-            self.client.login()
+            if not self.client.login():
+                console.print("[red]Failed to login to LinkedIn[/red]")
+                self.close_linkedin()
+                return False
             self.post_manager = PostManager(self.client)
             console.print("[green]✓ LinkedIn connected[/green]")
 
+        return True
+
     def close_linkedin(self):
         """Close LinkedIn connection"""
         if self.client:
@@ -149,10 +234,14 @@ class AutonomousAgentV2:
 
         return {'proceed': True, 'status': status}
 
-    def check_and_post_scheduled(self, session) -> int:
+    def check_and_post_scheduled(self, session, safety_check: Optional[Dict] = None) -> int:
         """
         Check for scheduled posts and publish them
 
+        Args:
+            session: Database session
+            safety_check: Result of check_safety_status for this cycle (checked here if omitted)
+
         Returns:
             Number of posts published
         """
@@ -160,18 +249,19 @@ class AutonomousAgentV2:
             return 0
 
         # Check safety first
-        safety_check = self.check_safety_status(session)
+        if safety_check is None:
+            safety_check = self.check_safety_status(session)
         if not safety_check['proceed']:
             console.print("[yellow]Skipping scheduled posts due to safety limits[/yellow]")
             return 0
 
-        # Get posts due to be posted
+        # Get posts due to be posted, oldest first; never more than the daily post limit
         now = datetime.utcnow()
         due_posts = session.query(Post).filter(
             Post.is_scheduled == True,
             Post.published == False,
             Post.scheduled_time <= now
-        ).all()
+        ).order_by(Post.scheduled_time).limit(self.safety_monitor.max_posts_per_day).all()
 
         if not due_posts:
             return 0
@@ -181,7 +271,7 @@ class AutonomousAgentV2:
         self.initialize_linkedin()
         published_count = 0
 
-        for post in due_posts:
+        for index, post in enumerate(due_posts, 1):
             # Double-check safety before each post
             if not self.safety_monitor.check_action_allowed('post')['allowed']:
                 console.print(f"[yellow]⚠️  Safety limit reached, stopping scheduled posts[/yellow]")
@@ -199,11 +289,10 @@ class AutonomousAgentV2:
                 success = self.post_manager.create_post(full_content, wait_for_confirmation=False)
 
                 if success:
-                    # Update database
+                    # Update database; committed together with the safety log entry below
                     post.published = True
                     post.published_at = datetime.utcnow()
                     post.is_scheduled = False
-                    session.commit()
 
                     # Log to safety monitor
                     self.safety_monitor.log_activity(
@@ -220,9 +309,9 @@ class AutonomousAgentV2:
                 else:
                     console.print(f"[yellow]⚠️  Failed to publish post[/yellow]")
 
-                # Human-like delay between posts
-                if len(due_posts) > 1 and published_count < len(due_posts):
-                    delay = random.randint(60, 180)
+                # Human-like delay between posts (none after the last one)
+                if index < len(due_posts):
+                    delay = random.randint(self.min_post_delay, self.max_post_delay)
                     console.print(f"[dim]Waiting {delay}s before next post...[/dim]")
                     time.sleep(delay)
 
@@ -233,34 +322,41 @@ class AutonomousAgentV2:
 
         return published_count
 
-    def execute_campaigns(self, session) -> Dict:
+    def execute_campaigns(self, session, safety_check: Optional[Dict] = None) -> Dict:
         """
         Execute active campaigns
 
+        Args:
+            session: Database session
+            safety_check: Result of check_safety_status for this cycle (checked here if omitted)
+
         Returns:
             Dict with execution results
         """
         if not self.enable_campaigns:
             return {'success': True, 'engagements': 0, 'message': 'Campaigns disabled'}
 
-        # Check safety first
-        safety_check = self.check_safety_status(session)
-        if not safety_check['proceed']:
-            console.print("[yellow]Skipping campaigns due to safety limits[/yellow]")
-            return {'success': False, 'engagements': 0, 'message': 'Safety limits reached'}
-
-        # Get active campaigns
+        # Get active campaigns; with none there is nothing to safety-check
         active_campaigns = self.campaign_manager.get_active_campaigns()
 
         if not active_campaigns:
             console.print("[dim]No active campaigns to execute[/dim]")
             return {'success': True, 'engagements': 0, 'message': 'No active campaigns'}
 
+        # Check safety
+        if safety_check is None:
+            safety_check = self.check_safety_status(session)
+        if not safety_check['proceed']:
+            console.print("[yellow]Skipping campaigns due to safety limits[/yellow]")
+            return {'success': False, 'engagements': 0, 'message': 'Safety limits reached'}
+
         console.print(f"\n[bold cyan]🎯 Executing {len(active_campaigns)} Active Campaign(s)[/bold cyan]")
         for campaign in active_campaigns:
             console.print(f"  - {campaign.name} ({campaign.campaign_type})")
 
         # Initialize campaign executor
+        from utils.campaign_executor import CampaignExecutor
+
         self.initialize_linkedin()
         self.campaign_executor = CampaignExecutor(session, self.client, self.config)
 
@@ -288,10 +384,14 @@ class AutonomousAgentV2:
             self.consecutive_errors += 1
             return {'success': False, 'engagements': 0, 'error': str(e)}
 
-    def process_network_growth(self, session) -> Dict:
+    def process_network_growth(self, session, safety_check: Optional[Dict] = None) -> Dict:
         """
         Process network growth activities
 
+        Args:
+            session: Database session
+            safety_check: Result of check_safety_status for this cycle (checked here if omitted)
+
         Returns:
             Dict with network growth results
         """
@@ -304,7 +404,8 @@ class AutonomousAgentV2:
             }
 
         # Check safety first
-        safety_check = self.check_safety_status(session)
+        if safety_check is None:
+            safety_check = self.check_safety_status(session)
         if not safety_check['proceed']:
             console.print("[yellow]Skipping network growth due to safety limits[/yellow]")
             return {
@@ -316,6 +417,32 @@ class AutonomousAgentV2:
 
         console.print(f"\n[bold cyan]🌱 Processing Network Growth Activities[/bold cyan]")
 
+        # Incoming requests can only be read from LinkedIn and sequence messages
+        # only sent through it, so start the browser when either has work
+        has_due_messages = self.process_message_sequences and session.query(SequenceEnrollment.id).filter(
+            SequenceEnrollment.status == 'active',
+            SequenceEnrollment.next_message_at <= datetime.utcnow()
+        ).first() is not None
+
+        if self.network_growth.auto_accept_enabled or has_due_messages:
+            try:
+                connected = self.initialize_linkedin()
+            except Exception as e:
+                console.print(f"[red]Error starting LinkedIn: {e}[/red]")
+                self.close_linkedin()
+                connected = False
+
+            if not connected:
+                console.print("[yellow]Skipping network growth: LinkedIn is not available[/yellow]")
+                return {
+                    'success': False,
+                    'incoming_processed': 0,
+                    'sequences_sent': 0,
+                    'message': 'LinkedIn not available'
+                }
+
+        self.network_growth.client = self.client
+
         incoming_processed = 0
         sequences_sent = 0
 
@@ -376,11 +503,64 @@ class AutonomousAgentV2:
                 'error': str(e)
             }
 
+    def get_next_event_time(self, session) -> Optional[datetime]:
+        """
+        Get the earliest upcoming scheduled post or sequence message time
+
+        Work that is already due but still pending after a cycle was held back
+        (safety or daily limits), so it does not bring the next cycle forward.
+
+        Returns:
+            Earliest future due time (UTC), or None if nothing is upcoming
+        """
+        now = datetime.utcnow()
+        event_times = []
+
+        if self.auto_post_scheduled:
+            event_times.append(session.query(func.min(Post.scheduled_time)).filter(
+                Post.is_scheduled == True,
+                Post.published == False,
+                Post.scheduled_time > now
+            ).scalar())
+
+        if self.enable_network_growth and self.process_message_sequences:
+            event_times.append(session.query(func.min(SequenceEnrollment.next_message_at)).filter(
+                SequenceEnrollment.status == 'active',
+                SequenceEnrollment.next_message_at > now
+            ).scalar())
+
+        event_times = [t for t in event_times if t is not None]
+        return min(event_times) if event_times else None
+
+    def calculate_sleep_time(self) -> float:
+        """
+        Calculate seconds to sleep before the next cycle
+
+        Sleeps check_interval by default, backs off by 1.5x per idle cycle up
+        to max_check_interval, and wakes early (but not before
+        min_check_interval, or check_interval if that is smaller) when a
+        scheduled post or sequence message is due.
+        """
+        if self.consecutive_errors >= 3:
+            return self.check_interval * 2  # Double sleep time on errors
+
+        sleep_time = self.check_interval
+        if self.idle_cycles:
+            sleep_time = min(self.check_interval * 1.5 ** self.idle_cycles, self.max_check_interval)
+
+        if self.next_event_time:
+            sleep_time = min(sleep_time, (self.next_event_time - datetime.utcnow()).total_seconds())
+
+        return max(min(self.min_check_interval, self.check_interval), sleep_time)
+
     def display_cycle_summary(self, session, posts_published: int, campaign_result: Dict, network_growth_result: Dict = None):
         """Display summary of current cycle"""
-        console.print(f"\n[bold blue]{'='*60}[/bold blue]")
-        console.print(f"[bold blue]Cycle {self.cycle_count} Summary[/bold blue]")
-        console.print(f"[bold blue]{'='*60}[/bold blue]")
+        # Collect the summary and print it in one call rather than one write per line
+        lines = [
+            f"\n[bold blue]{'='*60}[/bold blue]",
+            f"[bold blue]Cycle {self.cycle_count} Summary[/bold blue]",
+            f"[bold blue]{'='*60}[/bold blue]"
+        ]
 
         # Safety status
         safety_status = self.safety_monitor.get_safety_status()
@@ -391,53 +571,68 @@ class AutonomousAgentV2:
             'limit_reached': 'red'
         }.get(safety_status['status'], 'white')
 
-        console.print(f"\n[bold]Safety Status:[/bold] [{status_color}]{safety_status['status'].upper()}[/{status_color}]")
-        console.print(f"  Hourly: {safety_status['activity_counts']['last_hour']}/{safety_status['limits']['hourly_max']} ({safety_status['utilization']['hourly_percent']}%)")
-        console.print(f"  Daily: {safety_status['activity_counts']['last_24h']}/{safety_status['limits']['daily_max']} ({safety_status['utilization']['daily_percent']}%)")
-        console.print(f"  Risk Score: {safety_status['risk_score']:.2f}")
+        lines += [
+            f"\n[bold]Safety Status:[/bold] [{status_color}]{safety_status['status'].upper()}[/{status_color}]",
+            f"  Hourly: {safety_status['activity_counts']['last_hour']}/{safety_status['limits']['hourly_max']} ({safety_status['utilization']['hourly_percent']}%)",
+            f"  Daily: {safety_status['activity_counts']['last_24h']}/{safety_status['limits']['daily_max']} ({safety_status['utilization']['daily_percent']}%)",
+            f"  Risk Score: {safety_status['risk_score']:.2f}"
+        ]
 
         # This cycle
-        console.print(f"\n[bold]This Cycle:[/bold]")
-        console.print(f"  Scheduled posts published: {posts_published}")
-        console.print(f"  Campaign engagements: {campaign_result.get('engagements_performed', 0)}")
-        console.print(f"  Campaigns executed: {campaign_result.get('campaigns_executed', 0)}")
+        lines += [
+            f"\n[bold]This Cycle:[/bold]",
+            f"  Scheduled posts published: {posts_published}",
+            f"  Campaign engagements: {campaign_result.get('engagements_performed', 0)}",
+            f"  Campaigns executed: {campaign_result.get('campaigns_executed', 0)}"
+        ]
 
         if network_growth_result:
-            console.print(f"  Incoming requests accepted: {network_growth_result.get('incoming_processed', 0)}")
-            console.print(f"  Sequence messages sent: {network_growth_result.get('sequences_sent', 0)}")
+            lines += [
+                f"  Incoming requests accepted: {network_growth_result.get('incoming_processed', 0)}",
+                f"  Sequence messages sent: {network_growth_result.get('sequences_sent', 0)}"
+            ]
 
         # Totals
-        console.print(f"\n[bold]Session Totals:[/bold]")
-        console.print(f"  Total cycles: {self.cycle_count}")
-        console.print(f"  Total posts: {self.total_posts_published}")
-        console.print(f"  Total engagements: {self.total_campaign_engagements}")
-        console.print(f"  Total connections accepted: {self.total_incoming_requests_processed}")
-        console.print(f"  Total sequence messages: {self.total_sequence_messages_sent}")
+        lines += [
+            f"\n[bold]Session Totals:[/bold]",
+            f"  Total cycles: {self.cycle_count}",
+            f"  Total posts: {self.total_posts_published}",
+            f"  Total engagements: {self.total_campaign_engagements}",
+            f"  Total connections accepted: {self.total_incoming_requests_processed}",
+            f"  Total sequence messages: {self.total_sequence_messages_sent}"
+        ]
 
         # Network stats
-        network_stats = self.connection_manager.get_network_analytics(days_back=7)
-        console.print(f"\n[bold]Network (7 days):[/bold]")
-        console.print(f"  Total connections: {network_stats['total_connections']}")
-        console.print(f"  Avg quality score: {network_stats['avg_quality_score']:.1f}/10")
-        console.print(f"  Recent interactions: {network_stats['recent_interactions']}")
+        network_stats = self.connection_manager.get_network_summary(days_back=7)
+        lines += [
+            f"\n[bold]Network (7 days):[/bold]",
+            f"  Total connections: {network_stats['total_connections']}",
+            f"  Avg quality score: {network_stats['avg_quality_score']:.1f}/10",
+            f"  Recent interactions: {network_stats['recent_interactions']}"
+        ]
 
         # Active campaigns
         active_campaigns = self.campaign_manager.get_active_campaigns()
         if active_campaigns:
-            console.print(f"\n[bold]Active Campaigns:[/bold]")
+            lines.append(f"\n[bold]Active Campaigns:[/bold]")
             for campaign in active_campaigns:
-                console.print(f"  - {campaign.name}: {campaign.total_engagements} engagements ({campaign.success_rate:.1f}% success)")
+                lines.append(f"  - {campaign.name}: {campaign.total_engagements} engagements ({campaign.success_rate:.1f}% success)")
+
+        console.print("\n".join(lines))
 
     def run_cycle(self):
         """Run one cycle of autonomous operations"""
         self.cycle_count += 1
         session = None
+        self.next_event_time = None
 
         try:
-            console.print(f"\n{'='*70}")
-            console.print(f"[bold cyan]🤖 Autonomous Agent v2.0 - Cycle {self.cycle_count}[/bold cyan]")
-            console.print(f"[bold cyan]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/bold cyan]")
-            console.print(f"{'='*70}")
+            console.print(
+                f"\n{'='*70}\n"
+                f"[bold cyan]🤖 Autonomous Agent v2.0 - Cycle {self.cycle_count}[/bold cyan]\n"
+                f"[bold cyan]{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}[/bold cyan]\n"
+                f"{'='*70}"
+            )
 
             # Initialize session and managers
             session = self.initialize_session()
@@ -456,21 +651,37 @@ class AutonomousAgentV2:
                 campaign_result = {'success': False, 'engagements_performed': 0, 'message': 'Safety limits reached'}
                 network_growth_result = {'success': False, 'incoming_processed': 0, 'sequences_sent': 0, 'message': 'Safety limits reached'}
             else:
+                # The cycle-level safety check is shared by each step; every
+                # individual action is still gated by check_action_allowed
                 # Check and post scheduled content
                 console.print(f"\n[bold]1. Checking scheduled posts...[/bold]")
-                posts_published = self.check_and_post_scheduled(session)
+                posts_published = self.check_and_post_scheduled(session, safety_check)
 
                 # Execute campaigns
                 console.print(f"\n[bold]2. Executing campaigns...[/bold]")
-                campaign_result = self.execute_campaigns(session)
+                campaign_result = self.execute_campaigns(session, safety_check)
 
                 # Process network growth
                 console.print(f"\n[bold]3. Processing network growth...[/bold]")
-                network_growth_result = self.process_network_growth(session)
+                network_growth_result = self.process_network_growth(session, safety_check)
 
             # Display cycle summary
             self.display_cycle_summary(session, posts_published, campaign_result, network_growth_result)
 
+            # Track idle cycles and the next due event for adaptive sleeping
+            work_done = (
+                posts_published +
+                campaign_result.get('engagements_performed', 0) +
+                network_growth_result.get('incoming_processed', 0) +
+                network_growth_result.get('sequences_sent', 0)
+            )
+            # Capped so 1.5 ** idle_cycles stays finite on a long-idle agent; the
+            # backoff reaches max_check_interval well before the cap
+            self.idle_cycles = 0 if work_done else min(self.idle_cycles + 1, 32)
+            # During a safety pause the idle backoff decides when to look again
+            if safety_check['proceed']:
+                self.next_event_time = self.get_next_event_time(session)
+
             console.print(f"\n[green]✓ Cycle {self.cycle_count} completed[/green]")
 
             # Reset consecutive errors on successful cycle
@@ -487,8 +698,7 @@ class AutonomousAgentV2:
             if self.consecutive_errors >= 3:
                 console.print(f"[red]⚠️  {self.consecutive_errors} consecutive errors. Extending pause...[/red]")
 
-            import traceback
-            traceback.print_exc()
+            logger.exception("Cycle %d failed", self.cycle_count)
 
         finally:
             # Always close session and LinkedIn
@@ -509,6 +719,7 @@ class AutonomousAgentV2:
         # Display configuration
         console.print(f"\n[bold cyan]Configuration:[/bold cyan]")
         console.print(f"  Check interval: {self.check_interval}s ({self.check_interval/60:.1f} minutes)")
+        console.print(f"  Adaptive range: {self.min_check_interval}s - {self.max_check_interval}s")
         console.print(f"  Scheduled posts: {'✓ Enabled' if self.auto_post_scheduled else '✗ Disabled'}")
         console.print(f"  Campaigns: {'✓ Enabled' if self.enable_campaigns else '✗ Disabled'}")
         console.print(f"  Network growth: {'✓ Enabled' if self.enable_network_growth else '✗ Disabled'}")
@@ -518,10 +729,10 @@ class AutonomousAgentV2:
         console.print(f"  Max incoming requests: {self.max_incoming_requests_per_cycle}")
         console.print(f"  Process sequences: {'✓ Yes' if self.process_message_sequences else '✗ No'}")
 
-        # Display active campaigns
-        session = self.initialize_session()
-        campaign_manager = CampaignManager(session, self.config)
-        active_campaigns = campaign_manager.get_active_campaigns()
+        # Display active campaigns; the first cycle carries on with this session
+        # and closes it when done
+        self.initialize_session()
+        active_campaigns = self.campaign_manager.get_active_campaigns(with_targets=True)
 
         if active_campaigns:
             console.print(f"\n[bold cyan]Active Campaigns ({len(active_campaigns)}):[/bold cyan]")
@@ -532,7 +743,9 @@ class AutonomousAgentV2:
             console.print(f"\n[yellow]No active campaigns[/yellow]")
             console.print(f"[dim]Create and activate campaigns with: python main.py campaigns --action create[/dim]")
 
-        session.close()
+        # `kill -USR1 <pid>` wakes the agent early, e.g. right after scheduling a post
+        if hasattr(signal, 'SIGUSR1') and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGUSR1, lambda signum, frame: self.wake())
 
         console.print(f"\n[bold]Press Ctrl+C to stop[/bold]\n")
 
@@ -541,14 +754,14 @@ class AutonomousAgentV2:
                 self.run_cycle()
 
                 # Calculate sleep time (longer if consecutive errors)
-                sleep_time = self.check_interval
+                sleep_time = self.calculate_sleep_time()
                 if self.consecutive_errors >= 3:
-                    sleep_time = self.check_interval * 2  # Double sleep time on errors
                     console.print(f"\n[yellow]⚠️  Extended pause due to errors[/yellow]")
 
-                console.print(f"\n[dim]💤 Sleeping for {sleep_time}s ({sleep_time/60:.1f} minutes)...[/dim]")
+                console.print(f"\n[dim]💤 Sleeping for {sleep_time:.0f}s ({sleep_time/60:.1f} minutes)...[/dim]")
                 console.print(f"[dim]Next cycle at {(datetime.now() + timedelta(seconds=sleep_time)).strftime('%H:%M:%S')}[/dim]")
-                time.sleep(sleep_time)
+                if self._sleep_until_woken(sleep_time):
+                    console.print("[dim]Woken early, starting next cycle[/dim]")
 
         except KeyboardInterrupt:
             console.print(f"\n\n[yellow]{'='*70}[/yellow]")
@@ -5,6 +5,7 @@ Content Research CLI - Research optimal hashtags and content strategies
 Usage:
   python content_research_cli.py hashtags --industry "Technology"
   python content_research_cli.py hashtags-for-content "Your post content here"
+  python content_research_cli.py hashtags-for-contents --file drafts.txt
   python content_research_cli.py analyze-performance --days 90
   python content_research_cli.py content-ideas --num 5
   python content_research_cli.py posting-schedule
@@ -14,18 +15,12 @@ import sys
 import argparse
 import logging
 from pathlib import Path
-import yaml
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from database.db import Database
-from utils.hashtag_research import HashtagResearchEngine
-from utils.content_strategy import ContentStrategyAnalyzer
-from ai.anthropic_provider import AnthropicProvider
-from ai.openai_provider import OpenAIProvider
-from ai.gemini_provider import GeminiProvider
-from ai.local_llm_provider import LocalLLMProvider
+from utils.config_loader import load_config as load_config_file
 
 logging.basicConfig(
     level=logging.INFO,
@@ -41,35 +36,49 @@ def load_config():
         logger.error(f"Config file not found: {config_path}")
         return None
 
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    # Shared loader: libyaml-backed when available
+    return load_config_file(str(config_path))
 
 
 def get_ai_client(config):
     """Get AI client based on configuration"""
     provider = config.get('ai_provider', 'local')
 
+    # Provider SDKs are imported only for the provider in use
     try:
         if provider == 'anthropic':
+            from ai.anthropic_provider import AnthropicProvider
             return AnthropicProvider(config.get('anthropic', {}))
         elif provider == 'openai':
+            from ai.openai_provider import OpenAIProvider
             return OpenAIProvider(config.get('openai', {}))
         elif provider == 'gemini':
+            from ai.gemini_provider import GeminiProvider
             return GeminiProvider(config.get('gemini', {}))
         else:  # local or default
+            from ai.local_llm_provider import LocalLLMProvider
             return LocalLLMProvider(config.get('local_llm', {}))
     except Exception as e:
         logger.warning(f"Could not initialize AI client: {e}")
         return None
 
 
+def get_industry(args, config):
+    """Industry from --industry, falling back to user_profile.industry in the config"""
+    if args.industry:
+        return args.industry
+    return config.get('user_profile', {}).get('industry', 'Technology')
+
+
 def cmd_hashtags(args, config, db_session, ai_client):
     """Research trending hashtags for an industry"""
+    from utils.hashtag_research import HashtagResearchEngine
+
     print("\n🔍 Researching Trending Hashtags\n")
 
     engine = HashtagResearchEngine(db_session, config, ai_client)
 
-    industry = args.industry or config.get('user_profile', {}).get('industry', 'Technology')
+    industry = get_industry(args, config)
     print(f"Industry: {industry}")
     print(f"Analyzing last {args.days} days\n")
 
@@ -83,29 +92,34 @@ def cmd_hashtags(args, config, db_session, ai_client):
         print("No trending hashtags found. Post more content to build historical data!\n")
         return
 
-    print("📊 Trending Hashtags:\n")
+    # Results are collected and written in one go
+    lines = ["📊 Trending Hashtags:\n"]
     for i, hashtag_data in enumerate(trending, 1):
         hashtag = hashtag_data['hashtag']
         source = hashtag_data['source']
         score = hashtag_data['trend_score']
 
-        print(f"{i}. #{hashtag}")
-        print(f"   Source: {source}")
-        print(f"   Trend Score: {score:.1f}/100")
+        lines.append(f"{i}. #{hashtag}")
+        lines.append(f"   Source: {source}")
+        lines.append(f"   Trend Score: {score:.1f}/100")
 
         # Show reason for AI-researched trends
         if hashtag_data.get('reason'):
-            print(f"   Why trending: {hashtag_data['reason']}")
+            lines.append(f"   Why trending: {hashtag_data['reason']}")
 
         if hashtag_data.get('post_count', 0) > 0:
-            print(f"   Used in: {hashtag_data['post_count']} posts")
-            print(f"   Avg Engagement: {hashtag_data['avg_engagement']:.1f}")
+            lines.append(f"   Used in: {hashtag_data['post_count']} posts")
+            lines.append(f"   Avg Engagement: {hashtag_data['avg_engagement']:.1f}")
 
-        print()
+        lines.append('')
+
+    print('\n'.join(lines))
 
 
 def cmd_hashtags_for_content(args, config, db_session, ai_client):
     """Generate hashtag recommendations for specific content"""
+    from utils.hashtag_research import HashtagResearchEngine
+
     print("\n🎯 Generating Hashtags for Your Content\n")
 
     engine = HashtagResearchEngine(db_session, config, ai_client)
@@ -131,8 +145,42 @@ def cmd_hashtags_for_content(args, config, db_session, ai_client):
     print(f"  {recommendations['explanation']}\n")
 
 
+def cmd_hashtags_for_contents(args, config, db_session, ai_client):
+    """Generate hashtag recommendations for a file of posts, one per line"""
+    from utils.hashtag_research import HashtagResearchEngine
+
+    print("\n🎯 Generating Hashtags for Your Content\n")
+
+    with open(args.file, 'r', encoding='utf-8') as f:
+        contents = [line.strip() for line in f if line.strip()]
+
+    if not contents:
+        print(f"No content found in {args.file}\n")
+        return
+
+    engine = HashtagResearchEngine(db_session, config, ai_client)
+
+    print(f"Posts: {len(contents)}\n")
+
+    all_recommendations = engine.get_hashtag_recommendations_batch(
+        contents=contents,
+        max_hashtags=args.num
+    )
+
+    # Results are collected and written in one go
+    lines = ["💡 Recommended Hashtags:\n"]
+    for i, (content, recommendations) in enumerate(zip(contents, all_recommendations), 1):
+        lines.append(f"{i}. {content[:100]}{'...' if len(content) > 100 else ''}")
+        lines.append(f"   {recommendations['formatted']}")
+        lines.append('')
+
+    print('\n'.join(lines))
+
+
 def cmd_analyze_performance(args, config, db_session, ai_client):
     """Analyze content performance and get strategic recommendations"""
+    from utils.content_strategy import ContentStrategyAnalyzer
+
     print("\n📊 Analyzing Content Performance\n")
 
     analyzer = ContentStrategyAnalyzer(db_session, config, ai_client)
@@ -145,67 +193,72 @@ def cmd_analyze_performance(args, config, db_session, ai_client):
         print("❌ Not enough data to analyze. Create some posts first!\n")
         return
 
-    print(f"✅ Analyzed {analysis['analyzed_posts']} posts")
-    print(f"   Date Range: {analysis['date_range']}\n")
+    # Results are collected and written in one go
+    lines = [f"✅ Analyzed {analysis['analyzed_posts']} posts"]
+    lines.append(f"   Date Range: {analysis['date_range']}\n")
 
     # Overall metrics
-    print("📈 Overall Performance:")
+    lines.append("📈 Overall Performance:")
     metrics = analysis['overall_metrics']
     if metrics:
-        print(f"   Avg Views: {metrics.get('avg_views', 0):.1f}")
-        print(f"   Avg Reactions: {metrics.get('avg_reactions', 0):.1f}")
-        print(f"   Avg Comments: {metrics.get('avg_comments', 0):.1f}")
-        print(f"   Avg Shares: {metrics.get('avg_shares', 0):.1f}")
-        print()
+        lines.append(f"   Avg Views: {metrics.get('avg_views', 0):.1f}")
+        lines.append(f"   Avg Reactions: {metrics.get('avg_reactions', 0):.1f}")
+        lines.append(f"   Avg Comments: {metrics.get('avg_comments', 0):.1f}")
+        lines.append(f"   Avg Shares: {metrics.get('avg_shares', 0):.1f}")
+        lines.append('')
 
     # Content types
     if analysis['content_types']['types']:
-        print("🎭 Best Performing Content Types:")
+        lines.append("🎭 Best Performing Content Types:")
         for i, content_type in enumerate(analysis['content_types']['types'][:3], 1):
-            print(f"   {i}. {content_type['type'].title()}")
-            print(f"      Avg Engagement: {content_type['avg_engagement']:.1f}")
-            print(f"      Posts: {content_type['count']}")
-        print()
+            lines.append(f"   {i}. {content_type['type'].title()}")
+            lines.append(f"      Avg Engagement: {content_type['avg_engagement']:.1f}")
+            lines.append(f"      Posts: {content_type['count']}")
+        lines.append('')
 
     # Topics
     if analysis['topics']['topics']:
-        print("📌 Best Performing Topics:")
+        lines.append("📌 Best Performing Topics:")
         for i, topic in enumerate(analysis['topics']['topics'][:3], 1):
-            print(f"   {i}. {topic['topic'].title()}")
-            print(f"      Avg Engagement: {topic['avg_engagement']:.1f}")
-            print(f"      Posts: {topic['count']}")
-        print()
+            lines.append(f"   {i}. {topic['topic'].title()}")
+            lines.append(f"      Avg Engagement: {topic['avg_engagement']:.1f}")
+            lines.append(f"      Posts: {topic['count']}")
+        lines.append('')
 
     # Timing
     if analysis['posting_times']['time_slots']:
-        print("⏰ Best Times to Post:")
+        lines.append("⏰ Best Times to Post:")
         for i, time_slot in enumerate(analysis['posting_times']['time_slots'][:3], 1):
-            print(f"   {i}. {time_slot['time_slot'].replace('_', ' ').title()}")
-            print(f"      Avg Engagement: {time_slot['avg_engagement']:.1f}")
-        print()
+            lines.append(f"   {i}. {time_slot['time_slot'].replace('_', ' ').title()}")
+            lines.append(f"      Avg Engagement: {time_slot['avg_engagement']:.1f}")
+        lines.append('')
 
     # Days
     if analysis['days_of_week']['days']:
-        print("📅 Best Days to Post:")
+        lines.append("📅 Best Days to Post:")
         for i, day in enumerate(analysis['days_of_week']['days'][:3], 1):
-            print(f"   {i}. {day['day']}")
-            print(f"      Avg Engagement: {day['avg_engagement']:.1f}")
-        print()
+            lines.append(f"   {i}. {day['day']}")
+            lines.append(f"      Avg Engagement: {day['avg_engagement']:.1f}")
+        lines.append('')
 
     # Recommendations
-    print("💡 Strategic Recommendations:")
+    lines.append("💡 Strategic Recommendations:")
     for i, rec in enumerate(analysis['recommendations'], 1):
-        print(f"   {i}. {rec}")
-    print()
+        lines.append(f"   {i}. {rec}")
+    lines.append('')
+
+    print('\n'.join(lines))
 
 
 def cmd_content_ideas(args, config, db_session, ai_client):
     """Generate content ideas based on industry"""
+    from utils.content_strategy import ContentStrategyAnalyzer
+
     print("\n💡 Generating Content Ideas\n")
 
     analyzer = ContentStrategyAnalyzer(db_session, config, ai_client)
 
-    industry = args.industry or config.get('user_profile', {}).get('industry', 'Technology')
+    industry = get_industry(args, config)
     print(f"Industry: {industry}")
     print(f"Generating {args.num} content ideas...\n")
 
@@ -218,6 +271,8 @@ def cmd_content_ideas(args, config, db_session, ai_client):
 
 def cmd_posting_schedule(args, config, db_session, ai_client):
     """Get recommended posting schedule"""
+    from utils.content_strategy import ContentStrategyAnalyzer
+
     print("\n📅 Recommended Posting Schedule\n")
 
     analyzer = ContentStrategyAnalyzer(db_session, config, ai_client)
@@ -242,6 +297,8 @@ def cmd_posting_schedule(args, config, db_session, ai_client):
 
 def cmd_best_hashtags(args, config, db_session, ai_client):
     """Show best performing hashtags from historical data"""
+    from utils.hashtag_research import HashtagResearchEngine
+
     print("\n🏆 Best Performing Hashtags\n")
 
     engine = HashtagResearchEngine(db_session, config, ai_client)
@@ -258,14 +315,48 @@ def cmd_best_hashtags(args, config, db_session, ai_client):
         print("No hashtag performance data yet. Use hashtags in your posts to build history!\n")
         return
 
-    print("📊 Top Performing Hashtags:\n")
+    # Results are collected and written in one go
+    lines = ["📊 Top Performing Hashtags:\n"]
     for i, hashtag_data in enumerate(best, 1):
-        print(f"{i}. #{hashtag_data['hashtag']}")
-        print(f"   Posts: {hashtag_data['post_count']}")
-        print(f"   Avg Engagement: {hashtag_data['avg_engagement']:.1f}")
-        print(f"   Avg Views: {hashtag_data['avg_views']:.1f}")
-        print(f"   Avg Reactions: {hashtag_data['avg_reactions']:.1f}")
-        print()
+        lines.append(f"{i}. #{hashtag_data['hashtag']}")
+        lines.append(f"   Posts: {hashtag_data['post_count']}")
+        lines.append(f"   Avg Engagement: {hashtag_data['avg_engagement']:.1f}")
+        lines.append(f"   Avg Views: {hashtag_data['avg_views']:.1f}")
+        lines.append(f"   Avg Reactions: {hashtag_data['avg_reactions']:.1f}")
+        lines.append('')
+
+    print('\n'.join(lines))
+
+
+# Subcommands: name -> (handler, help text, [(argument, add_argument options)])
+COMMANDS = {
+    'hashtags': (cmd_hashtags, 'Research trending hashtags', [
+        ('--industry', {'type': str, 'help': 'Industry to research'}),
+        ('--days', {'type': int, 'default': 30, 'help': 'Days to analyze (default: 30)'}),
+        ('--limit', {'type': int, 'default': 20, 'help': 'Number of hashtags (default: 20)'}),
+    ]),
+    'hashtags-for-content': (cmd_hashtags_for_content, 'Get hashtags for specific content', [
+        ('content', {'type': str, 'help': 'Your post content'}),
+        ('--num', {'type': int, 'default': 5, 'help': 'Number of hashtags (default: 5)'}),
+    ]),
+    'hashtags-for-contents': (cmd_hashtags_for_contents, 'Get hashtags for many posts at once', [
+        ('--file', {'type': str, 'required': True, 'help': 'File with one post per line'}),
+        ('--num', {'type': int, 'default': 5, 'help': 'Number of hashtags per post (default: 5)'}),
+    ]),
+    'analyze-performance': (cmd_analyze_performance, 'Analyze content performance', [
+        ('--days', {'type': int, 'default': 90, 'help': 'Days to analyze (default: 90)'}),
+    ]),
+    'content-ideas': (cmd_content_ideas, 'Generate content ideas', [
+        ('--industry', {'type': str, 'help': 'Industry'}),
+        ('--num', {'type': int, 'default': 5, 'help': 'Number of ideas (default: 5)'}),
+    ]),
+    'posting-schedule': (cmd_posting_schedule, 'Get recommended posting schedule', []),
+    'best-hashtags': (cmd_best_hashtags, 'Show best performing hashtags', [
+        ('--days', {'type': int, 'default': 90, 'help': 'Days to analyze (default: 90)'}),
+        ('--min-posts', {'type': int, 'default': 3, 'help': 'Min posts required (default: 3)'}),
+        ('--limit', {'type': int, 'default': 10, 'help': 'Number of hashtags (default: 10)'}),
+    ]),
+}
 
 
 def main():
@@ -276,34 +367,10 @@ def main():
 
     subparsers = parser.add_subparsers(dest='command', help='Commands')
 
-    # Hashtags command
-    hashtags_parser = subparsers.add_parser('hashtags', help='Research trending hashtags')
-    hashtags_parser.add_argument('--industry', type=str, help='Industry to research')
-    hashtags_parser.add_argument('--days', type=int, default=30, help='Days to analyze (default: 30)')
-    hashtags_parser.add_argument('--limit', type=int, default=20, help='Number of hashtags (default: 20)')
-
-    # Hashtags for content
-    content_parser = subparsers.add_parser('hashtags-for-content', help='Get hashtags for specific content')
-    content_parser.add_argument('content', type=str, help='Your post content')
-    content_parser.add_argument('--num', type=int, default=5, help='Number of hashtags (default: 5)')
-
-    # Analyze performance
-    analyze_parser = subparsers.add_parser('analyze-performance', help='Analyze content performance')
-    analyze_parser.add_argument('--days', type=int, default=90, help='Days to analyze (default: 90)')
-
-    # Content ideas
-    ideas_parser = subparsers.add_parser('content-ideas', help='Generate content ideas')
-    ideas_parser.add_argument('--industry', type=str, help='Industry')
-    ideas_parser.add_argument('--num', type=int, default=5, help='Number of ideas (default: 5)')
-
-    # Posting schedule
-    subparsers.add_parser('posting-schedule', help='Get recommended posting schedule')
-
-    # Best hashtags
-    best_parser = subparsers.add_parser('best-hashtags', help='Show best performing hashtags')
-    best_parser.add_argument('--days', type=int, default=90, help='Days to analyze (default: 90)')
-    best_parser.add_argument('--min-posts', type=int, default=3, help='Min posts required (default: 3)')
-    best_parser.add_argument('--limit', type=int, default=10, help='Number of hashtags (default: 10)')
+    for name, (_, help_text, arguments) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        for argument, options in arguments:
+            command_parser.add_argument(argument, **options)
 
     args = parser.parse_args()
 
@@ -324,22 +391,10 @@ def main():
     ai_client = get_ai_client(config)
 
     # Execute command
-    commands = {
-        'hashtags': cmd_hashtags,
-        'hashtags-for-content': cmd_hashtags_for_content,
-        'analyze-performance': cmd_analyze_performance,
-        'content-ideas': cmd_content_ideas,
-        'posting-schedule': cmd_posting_schedule,
-        'best-hashtags': cmd_best_hashtags
-    }
-
-    if args.command in commands:
-        try:
-            commands[args.command](args, config, db_session, ai_client)
-        except Exception as e:
-            logger.error(f"Command failed: {e}", exc_info=True)
-    else:
-        parser.print_help()
+    try:
+        COMMANDS[args.command][0](args, config, db_session, ai_client)
+    except Exception as e:
+        logger.error(f"Command failed: {e}", exc_info=True)
 
 
 if __name__ == "__main__":
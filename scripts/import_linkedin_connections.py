@@ -2,11 +2,60 @@
 """Import LinkedIn connections from CSV export"""
 
 import csv
+import traceback
 import yaml
 from datetime import datetime
 from database.db import Database
+from database.models import Connection
 from linkedin.connection_manager import ConnectionManager
 
+# LinkedIn export columns read by the importer, in unpacking order
+CSV_COLUMNS = ('First Name', 'Last Name', 'Company', 'Position', 'Email Address', 'Connected On')
+
+# Pending rows are written to the database once this many have accumulated
+BATCH_SIZE = 1000
+
+# Profile URL slugs: "jane.doe@example.com" -> "jane-doe-at-example-com" and
+# "jane m. doe" -> "jane-m-doe", each in a single translate() pass
+EMAIL_SLUG_TABLE = str.maketrans({'@': '-at-', '.': '-'})
+NAME_SLUG_TABLE = str.maketrans({' ': '-', '.': None})
+
+MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
+
+def parse_connected_on(connected_on):
+    """Parse a 'Connected On' value, returning None when it is not a valid date
+
+    Split by hand rather than trying strptime formats in turn, so no row pays
+    for a failed parse.
+    """
+    if '/' in connected_on:
+        # Alternative format: "MM/DD/YYYY"
+        parts = connected_on.split('/')
+        if len(parts) != 3:
+            return None
+        month, day, year = parts
+    else:
+        # LinkedIn format: "DD MMM YYYY" (e.g., "15 Jan 2023")
+        parts = connected_on.split()
+        if len(parts) != 3:
+            return None
+        day, month_name, year = parts
+        month = MONTHS.get(month_name.title())
+        if month is None:
+            return None
+        month = str(month)
+
+    if not (day.isdigit() and month.isdigit() and year.isdigit() and len(year) == 4):
+        return None
+    try:
+        return datetime(int(year), int(month), int(day))
+    except ValueError:
+        # e.g. 31 Feb
+        return None
+
 def load_config():
     with open('config.yaml', 'r') as f:
         return yaml.safe_load(f)
@@ -27,24 +76,58 @@ def import_from_csv(csv_file_path):
     skipped = 0
     errors = 0
 
+    # Rows are collected and written in bulk every BATCH_SIZE rows, with one
+    # commit at the end: new connections keyed by profile URL, and updates
+    # keyed by connection id
+    new_records = {}
+    updated_records = {}
+    written = {'new': 0, 'updated': 0}
+
+    def write_batch(existing_ids):
+        if new_records:
+            session.bulk_insert_mappings(Connection, list(new_records.values()))
+            # Record the new ids so a later row for the same profile becomes
+            # an update rather than a duplicate insert (looked up in chunks, so
+            # the IN list stays under SQLite's bound-parameter limit)
+            existing_ids.update(
+                (profile_url, connection.id)
+                for profile_url, connection in conn_manager.get_connections_by_url(new_records).items()
+            )
+            written['new'] += len(new_records)
+            new_records.clear()
+        if updated_records:
+            session.bulk_update_mappings(Connection, list(updated_records.values()))
+            written['updated'] += len(updated_records)
+            updated_records.clear()
+        session.flush()
+
     try:
         with open(csv_file_path, 'r', encoding='utf-8') as f:
             # LinkedIn's export uses these column names:
             # First Name, Last Name, Email Address, Company, Position, Connected On
-            reader = csv.DictReader(f)
+            # Rows are read as plain lists and indexed by the header position;
+            # a column missing from the header reads as empty
+            reader = csv.reader(f)
+            header = {name: index for index, name in enumerate(next(reader, []))}
+            column_indexes = [header.get(name) for name in CSV_COLUMNS]
 
             print(f"\nReading connections from: {csv_file_path}")
             print("Processing...")
 
+            # Existing connections are matched in memory instead of one lookup per row
+            existing_ids = dict(session.query(Connection.profile_url, Connection.id))
+            now = datetime.utcnow()
+
             for row in reader:
+                if not row:
+                    # Blank line
+                    continue
                 try:
                     # Extract data from CSV
-                    first_name = row.get('First Name', '').strip()
-                    last_name = row.get('Last Name', '').strip()
-                    company = row.get('Company', '').strip()
-                    position = row.get('Position', '').strip()
-                    email = row.get('Email Address', '').strip()
-                    connected_on = row.get('Connected On', '').strip()
+                    first_name, last_name, company, position, email, connected_on = (
+                        row[index].strip() if index is not None else ''
+                        for index in column_indexes
+                    )
 
                     # Build full name
                     if first_name or last_name:
@@ -57,63 +140,73 @@ def import_from_csv(csv_file_path):
                     # Create profile URL (we'll use email as unique identifier if available)
                     # LinkedIn CSV doesn't include profile URLs, so we generate a placeholder
                     if email:
-                        profile_url = f"https://linkedin.com/in/imported-{email.replace('@', '-at-').replace('.', '-')}"
+                        profile_url = f"https://linkedin.com/in/imported-{email.translate(EMAIL_SLUG_TABLE)}"
                     else:
                         # Use name-based URL if no email
-                        url_slug = name.lower().replace(' ', '-').replace('.', '')
+                        url_slug = name.lower().translate(NAME_SLUG_TABLE)
                         profile_url = f"https://linkedin.com/in/imported-{url_slug}"
 
                     # Parse connection date
-                    connection_date = None
-                    if connected_on:
-                        try:
-                            # LinkedIn format: "DD MMM YYYY" (e.g., "15 Jan 2023")
-                            connection_date = datetime.strptime(connected_on, '%d %b %Y')
-                        except:
-                            try:
-                                # Alternative format: "MM/DD/YYYY"
-                                connection_date = datetime.strptime(connected_on, '%m/%d/%Y')
-                            except:
-                                pass
-
-                    # Add connection
-                    connection = conn_manager.add_connection(
-                        name=name,
-                        profile_url=profile_url,
-                        title=position if position else None,
-                        company=company if company else None,
-                        connection_source="linkedin_csv_import"
-                    )
+                    connection_date = parse_connected_on(connected_on) if connected_on else None
 
-                    # Update connection date if we have it
+                    # Same fields ConnectionManager.add_connection sets on insert/update
+                    fields = {
+                        'name': name,
+                        'title': position if position else None,
+                        'company': company if company else None,
+                        'location': None
+                    }
                     if connection_date:
-                        connection.connection_date = connection_date
-                        session.commit()
+                        fields['connection_date'] = connection_date
 
-                    imported += 1
+                    connection_id = existing_ids.get(profile_url)
+                    if connection_id is not None:
+                        fields['updated_at'] = now
+                        updated_records.setdefault(connection_id, {'id': connection_id}).update(fields)
+                    elif profile_url in new_records:
+                        # Repeated row in the export: the later values win
+                        new_records[profile_url].update(fields)
+                    else:
+                        # A new connection has no engagement yet, so its quality score is 0
+                        new_records[profile_url] = {
+                            'profile_url': profile_url,
+                            'connection_date': now,
+                            'connection_source': 'linkedin_csv_import',
+                            'is_active': True,
+                            'quality_score': 0.0,
+                            'engagement_level': 'none',
+                            **fields
+                        }
 
-                    if imported % 10 == 0:
-                        print(f"  Imported {imported} connections...")
+                    imported += 1
+                    if len(new_records) + len(updated_records) >= BATCH_SIZE:
+                        write_batch(existing_ids)
 
                 except Exception as e:
-                    print(f"  ✗ Error importing {row.get('First Name', '')} {row.get('Last Name', '')}: {e}")
+                    first_index, last_index = column_indexes[:2]
+                    name_parts = [row[i] for i in (first_index, last_index) if i is not None and i < len(row)]
+                    print(f"  ✗ Error importing {' '.join(name_parts)}: {e}")
                     errors += 1
                     continue
 
+        write_batch(existing_ids)
+        session.commit()
+        print(f"  Wrote {written['new']} new and {written['updated']} updated connections")
+
         print("\n" + "="*60)
         print("Import Complete")
         print("="*60)
         print(f"✓ Successfully imported: {imported}")
         print(f"⚠ Skipped: {skipped}")
         print(f"✗ Errors: {errors}")
-        print(f"\nTotal connections in database: {conn_manager.get_all_connections().__len__()}")
+        print(f"\nTotal connections in database: {conn_manager.count_connections()}")
 
         # Show sample of imported connections
         print("\n" + "="*60)
         print("Sample of Imported Connections")
         print("="*60)
 
-        sample = conn_manager.get_all_connections()[:5]
+        sample = conn_manager.get_all_connections(limit=5)
         for conn in sample:
             print(f"\n  {conn.name}")
             print(f"    Title: {conn.title or 'N/A'}")
@@ -128,7 +221,6 @@ def import_from_csv(csv_file_path):
         return False
     except Exception as e:
         print(f"\n✗ Error: {e}")
-        import traceback
         traceback.print_exc()
         return False
     finally:
@@ -13,6 +13,10 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 logger = logging.getLogger(__name__)
 
+# Bit of PRAGMA user_version set once this migration has been applied. Each
+# migration script owns one bit, so the scripts can run in any order
+MIGRATION_FLAG = 1 << 2
+
 
 def migrate_database():
     """Add hashtag_performance table to the database."""
@@ -41,49 +45,63 @@ def migrate_database():
         conn = sqlite3.connect(str(db_path))
         cursor = conn.cursor()
 
-        # Check if table already exists
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='hashtag_performance'
-        """)
-
-        if cursor.fetchone():
+        # Reading the schema version is cheaper than inspecting sqlite_master
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] & MIGRATION_FLAG:
             logger.info("Table 'hashtag_performance' already exists")
             conn.close()
             return True
 
-        # Create hashtag_performance table
-        logger.info("Creating hashtag_performance table...")
-
-        cursor.execute("""
-            CREATE TABLE hashtag_performance (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                post_id INTEGER NOT NULL,
-                hashtag VARCHAR(100) NOT NULL,
-                recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (post_id) REFERENCES posts (id)
-            )
-        """)
-
-        # Create indexes for better query performance
-        logger.info("Creating indexes...")
-
-        cursor.execute("""
-            CREATE INDEX idx_hashtag_performance_post_id
-            ON hashtag_performance(post_id)
-        """)
-
-        cursor.execute("""
-            CREATE INDEX idx_hashtag_performance_hashtag
-            ON hashtag_performance(hashtag)
-        """)
-
-        cursor.execute("""
-            CREATE INDEX idx_hashtag_performance_recorded_at
-            ON hashtag_performance(recorded_at)
-        """)
+        # The check, the table, its indexes and the migration flag are all
+        # written in one transaction and committed together
+        with conn:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Check if table already exists (databases created by create_all()
+            # have it without the migration flag)
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='table' AND name='hashtag_performance'
+            """)
+            table_exists = cursor.fetchone() is not None
+
+            if not table_exists:
+                # Create hashtag_performance table
+                logger.info("Creating hashtag_performance table...")
+
+                cursor.execute("""
+                    CREATE TABLE hashtag_performance (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        post_id INTEGER NOT NULL,
+                        hashtag VARCHAR(100) NOT NULL,
+                        recorded_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+                        FOREIGN KEY (post_id) REFERENCES posts (id)
+                    )
+                """)
+
+                # Create indexes for better query performance
+                logger.info("Creating indexes...")
+
+                cursor.execute("""
+                    CREATE INDEX idx_hashtag_performance_post_id
+                    ON hashtag_performance(post_id)
+                """)
+
+                # One composite index serves both hashtag lookups and per-hashtag
+                # date ranges
+                cursor.execute("""
+                    CREATE INDEX idx_hashtag_perf_hashtag_time
+                    ON hashtag_performance(hashtag, recorded_at)
+                """)
+
+            cursor.execute("PRAGMA user_version")
+            cursor.execute(f"PRAGMA user_version = {cursor.fetchone()[0] | MIGRATION_FLAG}")
+
+        if table_exists:
+            logger.info("Table 'hashtag_performance' already exists")
+            conn.close()
+            return True
 
-        conn.commit()
         logger.info("Migration completed successfully!")
 
         # Verify the table was created
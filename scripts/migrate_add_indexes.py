@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Database migration: Add query indexes
+
+Creates indexes declared on the models for databases that were created
+before the index existed (create_all() does not add indexes to existing
+tables). Safe to run repeatedly.
+"""
+
+import sqlite3
+import logging
+from pathlib import Path
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+# (index name, table, columns)
+INDEXES = [
+    ('idx_connections_top', 'connections', 'is_active, quality_score, messages_sent, messages_received'),
+    ('idx_posts_due', 'posts', 'is_scheduled, published, scheduled_time'),
+    ('idx_posts_created_at', 'posts', 'created_at'),
+    ('idx_hashtag_performance_post_id', 'hashtag_performance', 'post_id'),
+    ('idx_hashtag_perf_hashtag_time', 'hashtag_performance', 'hashtag, recorded_at'),
+]
+
+
+def migrate_database():
+    """Add missing query indexes to the database."""
+
+    # Find database
+    possible_paths = [
+        Path(__file__).parent.parent / 'linkedin_assistant.db',
+        Path(__file__).parent.parent / 'data' / 'linkedin_bot.db',
+        Path(__file__).parent.parent / 'data' / 'linkedin_assistant.db',
+    ]
+
+    db_path = None
+    for path in possible_paths:
+        if path.exists():
+            db_path = path
+            break
+
+    if not db_path:
+        logger.error("Could not find database file")
+        logger.info(f"Searched in: {', '.join(str(p) for p in possible_paths)}")
+        return False
+
+    logger.info(f"Found database at: {db_path}")
+
+    try:
+        conn = sqlite3.connect(str(db_path))
+        cursor = conn.cursor()
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = {row[0] for row in cursor.fetchall()}
+
+        for index_name, table, columns in INDEXES:
+            if table not in tables:
+                # e.g. hashtag_performance before its own migration has run
+                logger.info(f"Table '{table}' does not exist, skipping index '{index_name}'")
+                continue
+
+            cursor.execute("""
+                SELECT name FROM sqlite_master
+                WHERE type='index' AND name=?
+            """, (index_name,))
+
+            if cursor.fetchone():
+                logger.info(f"Index '{index_name}' already exists")
+                continue
+
+            logger.info(f"Creating index {index_name} on {table}({columns})...")
+            cursor.execute(f"CREATE INDEX {index_name} ON {table}({columns})")
+
+        conn.commit()
+        conn.close()
+        logger.info("Migration completed successfully!")
+        return True
+
+    except Exception as e:
+        logger.error(f"Migration failed: {e}")
+        return False
+
+
+if __name__ == "__main__":
+    success = migrate_database()
+    exit(0 if success else 1)
@@ -11,6 +11,10 @@ Run this script ONCE to upgrade your database.
 import sqlite3
 from pathlib import Path
 
+# Bit of PRAGMA user_version set once this migration has been applied. Each
+# migration script owns one bit, so the scripts can run in any order
+MIGRATION_FLAG = 1 << 1
+
 def migrate_database():
     """Add lead scoring columns to connection_requests table"""
 
@@ -40,47 +44,60 @@ def migrate_database():
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
 
-        # Check if columns already exist
-        cursor.execute("PRAGMA table_info(connection_requests)")
-        columns = [row[1] for row in cursor.fetchall()]
-
-        migrations_applied = 0
-
-        # Add lead_score column if it doesn't exist
-        if 'lead_score' not in columns:
-            print("   Adding 'lead_score' column...")
-            cursor.execute("""
-                ALTER TABLE connection_requests
-                ADD COLUMN lead_score REAL
-            """)
-            migrations_applied += 1
-        else:
-            print("   ✓ 'lead_score' column already exists")
-
-        # Add score_breakdown column if it doesn't exist
-        if 'score_breakdown' not in columns:
-            print("   Adding 'score_breakdown' column...")
-            cursor.execute("""
-                ALTER TABLE connection_requests
-                ADD COLUMN score_breakdown TEXT
-            """)
-            migrations_applied += 1
-        else:
-            print("   ✓ 'score_breakdown' column already exists")
-
-        # Add priority_tier column if it doesn't exist
-        if 'priority_tier' not in columns:
-            print("   Adding 'priority_tier' column...")
-            cursor.execute("""
-                ALTER TABLE connection_requests
-                ADD COLUMN priority_tier VARCHAR(20)
-            """)
-            migrations_applied += 1
-        else:
-            print("   ✓ 'priority_tier' column already exists")
-
-        # Commit changes
-        conn.commit()
+        # Reading the schema version is cheaper than inspecting the table
+        cursor.execute("PRAGMA user_version")
+        if cursor.fetchone()[0] & MIGRATION_FLAG:
+            print("\n✅ Database already up to date - no changes needed")
+            conn.close()
+            return True
+
+        # The column check, every ALTER and the migration flag are written in
+        # one transaction, so the schema changes are committed together with
+        # a single sync
+        with conn:
+            cursor.execute("BEGIN IMMEDIATE")
+
+            # Check if columns already exist
+            cursor.execute("PRAGMA table_info(connection_requests)")
+            columns = [row[1] for row in cursor.fetchall()]
+
+            migrations_applied = 0
+
+            # Add lead_score column if it doesn't exist
+            if 'lead_score' not in columns:
+                print("   Adding 'lead_score' column...")
+                cursor.execute("""
+                    ALTER TABLE connection_requests
+                    ADD COLUMN lead_score REAL
+                """)
+                migrations_applied += 1
+            else:
+                print("   ✓ 'lead_score' column already exists")
+
+            # Add score_breakdown column if it doesn't exist
+            if 'score_breakdown' not in columns:
+                print("   Adding 'score_breakdown' column...")
+                cursor.execute("""
+                    ALTER TABLE connection_requests
+                    ADD COLUMN score_breakdown TEXT
+                """)
+                migrations_applied += 1
+            else:
+                print("   ✓ 'score_breakdown' column already exists")
+
+            # Add priority_tier column if it doesn't exist
+            if 'priority_tier' not in columns:
+                print("   Adding 'priority_tier' column...")
+                cursor.execute("""
+                    ALTER TABLE connection_requests
+                    ADD COLUMN priority_tier VARCHAR(20)
+                """)
+                migrations_applied += 1
+            else:
+                print("   ✓ 'priority_tier' column already exists")
+
+            cursor.execute("PRAGMA user_version")
+            cursor.execute(f"PRAGMA user_version = {cursor.fetchone()[0] | MIGRATION_FLAG}")
 
         if migrations_applied > 0:
             print(f"\n✅ Migration completed successfully!")
@@ -7,6 +7,10 @@ Adds scheduling columns to existing database
 import sqlite3
 import os
 
+# Bit of PRAGMA user_version set once this migration has been applied. Each
+# migration script owns one bit, so the scripts can run in any order
+MIGRATION_FLAG = 1 << 0
+
 def migrate_database():
     """Add scheduling columns to posts table"""
 
@@ -20,6 +24,14 @@ def migrate_database():
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
 
+    # Reading the schema version is cheaper than inspecting the table
+    cursor.execute("PRAGMA user_version")
+    user_version = cursor.fetchone()[0]
+    if user_version & MIGRATION_FLAG:
+        print("✓ Database is already up to date!")
+        conn.close()
+        return
+
     # Check if columns already exist
     cursor.execute("PRAGMA table_info(posts)")
     columns = [column[1] for column in cursor.fetchall()]
@@ -34,6 +46,7 @@ def migrate_database():
 
     if not migrations_needed:
         print("✓ Database is already up to date!")
+        cursor.execute(f"PRAGMA user_version = {user_version | MIGRATION_FLAG}")
         conn.close()
         return
 
@@ -56,6 +69,7 @@ def migrate_database():
             """)
             print("✓ Added is_scheduled column")
 
+        cursor.execute(f"PRAGMA user_version = {user_version | MIGRATION_FLAG}")
         conn.commit()
         print("\n✓ Migration completed successfully!")
 
@@ -13,6 +13,7 @@ Usage:
 """
 
 import sys
+import traceback
 import argparse
 from pathlib import Path
 
@@ -150,7 +151,6 @@ def main():
             commands[args.command](args)
         except Exception as e:
             print(f"\n❌ Error: {str(e)}\n")
-            import traceback
             traceback.print_exc()
             sys.exit(1)
     else:
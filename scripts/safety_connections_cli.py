@@ -158,9 +158,8 @@ def connections(action, name, url, title, company, limit):
             top_table.add_column("Quality", justify="center", width=8)
             top_table.add_column("Messages", justify="center", width=10)
             for i, conn in enumerate(top_connections, 1):
-                total_messages = conn.messages_sent + conn.messages_received
                 top_table.add_row(f"#{i}", conn.name[:25], (conn.title or "N/A")[:35],
-                                f"[bold green]{conn.quality_score:.1f}[/bold green]", str(total_messages))
+                                f"[bold green]{conn.quality_score:.1f}[/bold green]", str(conn.total_messages))
             console.print(top_table)
             console.print()
 
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Test script for the autonomous agent's adaptive sleep between cycles"""
+
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root and scripts to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / 'scripts'))
+
+from database.models import Post
+from autonomous_agent_v2 import AutonomousAgentV2
+
+
+def make_agent(**agent_config):
+    """Agent on an in-memory database with the given autonomous_agent settings"""
+    config = {
+        'database': {
+            'type': 'sqlite',
+            'path': ':memory:'
+        },
+        'ai_provider': 'local',
+        'safety': {
+            'max_actions_per_hour': 1
+        },
+        'autonomous_agent': agent_config
+    }
+    return AutonomousAgentV2(config=config)
+
+
+def test_sleep_time():
+    """Test calculate_sleep_time bounds and backoff"""
+    print("\n" + "="*60)
+    print("TESTING SLEEP TIME")
+    print("="*60)
+
+    agent = make_agent(check_interval=300, min_check_interval=60)
+
+    print("\nTest 1: Default and idle backoff...")
+    assert agent.calculate_sleep_time() == 300
+    agent.idle_cycles = 2
+    assert agent.calculate_sleep_time() == 300 * 1.5 ** 2
+    agent.idle_cycles = 0
+    print("  ✓ check_interval by default, 1.5x per idle cycle")
+
+    print("\nTest 2: Waking early for a due event...")
+    agent.next_event_time = datetime.utcnow() + timedelta(seconds=120)
+    assert 110 < agent.calculate_sleep_time() <= 120
+    agent.next_event_time = datetime.utcnow() + timedelta(seconds=5)
+    assert agent.calculate_sleep_time() == 60
+    print("  ✓ Wakes for the event, but not before min_check_interval")
+
+    print("\nTest 3: A check_interval below min_check_interval is honoured...")
+    agent = make_agent(check_interval=30, min_check_interval=60)
+    assert agent.calculate_sleep_time() == 30
+    agent.next_event_time = datetime.utcnow() + timedelta(seconds=5)
+    assert agent.calculate_sleep_time() == 30
+    print("  ✓ Sleeps 30s, not 60s")
+
+    print("\n✓ All sleep time tests passed!")
+    return True
+
+
+def test_next_event_time():
+    """Test that only upcoming work brings the next cycle forward"""
+    print("\n" + "="*60)
+    print("TESTING NEXT EVENT TIME")
+    print("="*60)
+
+    agent = make_agent(check_interval=300, min_check_interval=60)
+    session = agent.initialize_session()
+    now = datetime.utcnow()
+
+    print("\nTest 1: A past-due post is ignored...")
+    session.add(Post(content='Overdue', is_scheduled=True, published=False,
+                     scheduled_time=now - timedelta(minutes=30)))
+    session.commit()
+    assert agent.get_next_event_time(session) is None
+    print("  ✓ No next event")
+
+    print("\nTest 2: An upcoming post is used...")
+    upcoming = now + timedelta(minutes=10)
+    session.add(Post(content='Upcoming', is_scheduled=True, published=False, scheduled_time=upcoming))
+    session.commit()
+    assert agent.get_next_event_time(session) == upcoming
+    print(f"  ✓ Next event at {upcoming}")
+
+    print("\nTest 3: A cycle blocked by safety limits keeps the idle backoff...")
+    agent.safety_monitor.log_activity('like', 'post', 'test-post-1', success=True)
+    agent.run_cycle()
+    assert agent.next_event_time is None
+    assert agent.idle_cycles == 1
+    assert agent.calculate_sleep_time() == 300 * 1.5
+    print(f"  ✓ Sleeping {agent.calculate_sleep_time():.0f}s during the pause")
+
+    print("\n✓ All next event time tests passed!")
+    return True
+
+
+if __name__ == "__main__":
+    try:
+        sleep_passed = test_sleep_time()
+        event_passed = test_next_event_time()
+
+        print("\n" + "="*60)
+        print("TEST SUMMARY")
+        print("="*60)
+        print(f"Sleep time: {'✓ PASSED' if sleep_passed else '✗ FAILED'}")
+        print(f"Next event time: {'✓ PASSED' if event_passed else '✗ FAILED'}")
+
+        if sleep_passed and event_passed:
+            print("\n🎉 All tests passed successfully!")
+            sys.exit(0)
+        else:
+            print("\n❌ Some tests failed")
+            sys.exit(1)
+
+    except Exception as e:
+        print(f"\n❌ Test failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
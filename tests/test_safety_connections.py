@@ -3,9 +3,13 @@
 
 import sys
 from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from sqlalchemy import event
 from database.db import Database
 from utils.safety_monitor import SafetyMonitor
 from linkedin.connection_manager import ConnectionManager
+from automation_modes.connection_sync import ConnectionSyncMode
 
 def test_safety_monitor():
     """Test SafetyMonitor functionality"""
@@ -148,7 +152,8 @@ def test_connection_manager():
     top_connections = conn_manager.get_top_connections(limit=2)
     print(f"  Top {len(top_connections)} connections:")
     for i, conn in enumerate(top_connections, 1):
-        print(f"    {i}. {conn.name}: {conn.quality_score:.1f}/10")
+        print(f"    {i}. {conn.name}: {conn.quality_score:.1f}/10 ({conn.total_messages} messages)")
+    assert top_connections[0].total_messages == 8
 
     # Test 5: Mark target audience
     print("\nTest 5: Marking target audience...")
@@ -183,11 +188,79 @@ def test_connection_manager():
     return True
 
 
+def test_connection_sync_queries():
+    """Test that ConnectionSyncMode doesn't re-query existing connections"""
+    print("\n" + "="*60)
+    print("TESTING CONNECTION SYNC QUERIES")
+    print("="*60)
+
+    config = {
+        'database': {
+            'type': 'sqlite',
+            'path': ':memory:'
+        },
+        'connections': {}
+    }
+
+    db = Database(config)
+    session = db.get_session()
+    conn_manager = ConnectionManager(session, config)
+
+    for i in range(5):
+        conn_manager.add_connection(
+            name=f"Existing {i}",
+            profile_url=f"https://linkedin.com/in/existing{i}",
+            title="Engineer"
+        )
+
+    # Interleave new profiles with existing ones whose title changed
+    scraped = []
+    for i in range(5):
+        scraped.append({'name': f"New {i}", 'profile_url': f"https://linkedin.com/in/new{i}",
+                        'title': "Designer", 'company': None, 'location': None})
+        scraped.append({'name': f"Existing {i}", 'profile_url': f"https://linkedin.com/in/existing{i}",
+                        'title': "Senior Engineer", 'company': None, 'location': None})
+
+    driver = SimpleNamespace(get=lambda url: None)
+    sync = ConnectionSyncMode({}, SimpleNamespace(driver=driver), None, session, None)
+
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.engine, 'before_cursor_execute', record_statement)
+    with patch.object(ConnectionSyncMode, '_scrape_all_connections', return_value=scraped), \
+            patch('automation_modes.connection_sync.time.sleep'):
+        results = sync.run()
+    event.remove(db.engine, 'before_cursor_execute', record_statement)
+
+    selects = [s for s in statements if s.lstrip().upper().startswith('SELECT')]
+    print(f"  Statements: {len(statements)} ({len(selects)} SELECT)")
+    print(f"  New: {results['connections_new']}, Updated: {results['connections_updated']}")
+
+    assert results['success']
+    assert results['connections_new'] == 5
+    assert results['connections_updated'] == 5
+    # Only the bulk lookup reads the connections table
+    assert len(selects) == 1
+
+    assert conn_manager.get_connection("https://linkedin.com/in/existing0").title == "Senior Engineer"
+    assert conn_manager.get_connection("https://linkedin.com/in/new0").engagement_level == 'none'
+
+    session.close()
+    db.close()
+
+    print("\n✓ Connection sync query test passed!")
+    return True
+
+
 if __name__ == "__main__":
     try:
         # Run tests
         safety_passed = test_safety_monitor()
         connection_passed = test_connection_manager()
+        sync_passed = test_connection_sync_queries()
 
         # Summary
         print("\n" + "="*60)
@@ -195,8 +268,9 @@ if __name__ == "__main__":
         print("="*60)
         print(f"SafetyMonitor: {'✓ PASSED' if safety_passed else '✗ FAILED'}")
         print(f"ConnectionManager: {'✓ PASSED' if connection_passed else '✗ FAILED'}")
+        print(f"ConnectionSync: {'✓ PASSED' if sync_passed else '✗ FAILED'}")
 
-        if safety_passed and connection_passed:
+        if safety_passed and connection_passed and sync_passed:
             print("\n🎉 All tests passed successfully!")
             sys.exit(0)
         else:
@@ -1,6 +1,18 @@
 """Utilities for LinkedIn Assistant Bot"""
 
-from .scheduler import Scheduler
-from .safety_monitor import SafetyMonitor
+import importlib
 
 __all__ = ['Scheduler', 'SafetyMonitor']
+
+# Submodule defining each exported name. Imported on first access so that
+# e.g. utils.config_loader does not pull in the scheduler and browser stack.
+_EXPORTS = {
+    'Scheduler': '.scheduler',
+    'SafetyMonitor': '.safety_monitor'
+}
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,6 +2,7 @@
 
 import json
 import random
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm import Session
@@ -76,7 +77,7 @@ class ABTestingEngine:
                     test_id=test.id,
                     variant_name=variant_cfg.get('name', f'variant_{idx}'),
                     variant_label=variant_cfg.get('label', f'Variant {idx}'),
-                    variant_config=json.dumps(variant_cfg.get('config', {})),
+                    variant_config=variant_cfg.get('config', {}),
                     is_control=variant_cfg.get('is_control', idx == 0)
                 )
                 self.db.add(variant)
@@ -195,6 +196,41 @@ class ABTestingEngine:
 
         return assignment
 
+    def assign_new_posts(
+        self,
+        post_variants: List[Tuple[Post, TestVariant]],
+        assignment_method: str = 'manual'
+    ) -> int:
+        """
+        Assign freshly created posts to known variants with one bulk insert
+
+        Unlike assign_post_to_variant, this skips the already-assigned check,
+        so it is only for posts created by the caller in this session.
+
+        Args:
+            post_variants: (post, variant) pairs; posts must be flushed so they have IDs
+            assignment_method: Assignment method (random, manual, weighted)
+
+        Returns:
+            Number of assignments created
+        """
+        self.db.bulk_insert_mappings(TestAssignment, [
+            {
+                'test_id': variant.test_id,
+                'variant_id': variant.id,
+                'post_id': post.id,
+                'assignment_method': assignment_method
+            }
+            for post, variant in post_variants
+        ])
+
+        for _, variant in post_variants:
+            variant.posts_count += 1
+
+        self.db.commit()
+
+        return len(post_variants)
+
     def sync_test_metrics(self, test_id: int) -> Dict:
         """
         Sync metrics from Analytics to test assignments and calculate variant stats
@@ -215,13 +251,23 @@ class ABTestingEngine:
             TestAssignment.test_id == test_id
         ).all()
 
+        # Analytics for every assigned post in one query (first row per post)
+        analytics_by_post = {}
+        post_ids = [assignment.post_id for assignment in assignments]
+        if post_ids:
+            for analytics in self.db.query(Analytics).filter(
+                Analytics.post_id.in_(post_ids)
+            ).order_by(Analytics.id):
+                analytics_by_post.setdefault(analytics.post_id, analytics)
+
         updated_count = 0
+        assignments_by_variant = defaultdict(list)
 
         for assignment in assignments:
+            assignments_by_variant[assignment.variant_id].append(assignment)
+
             # Get analytics for this post
-            analytics = self.db.query(Analytics).filter(
-                Analytics.post_id == assignment.post_id
-            ).first()
+            analytics = analytics_by_post.get(assignment.post_id)
 
             if analytics:
                 # Sync metrics
@@ -233,9 +279,7 @@ class ABTestingEngine:
 
         for variant in variants:
             # Sum up all metrics from assignments
-            variant_assignments = self.db.query(TestAssignment).filter(
-                TestAssignment.variant_id == variant.id
-            ).all()
+            variant_assignments = assignments_by_variant.get(variant.id, [])
 
             variant.total_views = sum(a.views for a in variant_assignments)
             variant.total_likes = sum(a.likes for a in variant_assignments)
@@ -306,6 +350,10 @@ class ABTestingEngine:
         # Get control variant (or first variant)
         control = next((v for v in variants if v.is_control), variants[0])
 
+        # Engagement rates for every variant, fetched once for all comparisons
+        rates_by_variant = self._engagement_rates_by_variant(test_id)
+        control_rates = rates_by_variant.get(control.id, [])
+
         # Compare each variant to control
         for variant in variants:
             variant_result = {
@@ -323,7 +371,7 @@ class ABTestingEngine:
             if variant.id != control.id:
                 # Calculate statistical significance
                 p_value, is_significant = self._two_sample_t_test(
-                    control, variant, test.confidence_level
+                    control_rates, rates_by_variant.get(variant.id, []), test.confidence_level
                 )
 
                 variant_result['p_value'] = round(p_value, 4) if p_value else None
@@ -355,7 +403,7 @@ class ABTestingEngine:
             results['variants'].append(variant_result)
 
         # Determine winner
-        winner = self._determine_winner(variants, control, test.confidence_level)
+        winner = self._determine_winner(variants, control, rates_by_variant, test.confidence_level)
 
         if winner:
             results['winner'] = {
@@ -430,8 +478,7 @@ class ABTestingEngine:
         if not test:
             return {'success': False, 'error': 'Test not found'}
 
-        # Sync and analyze
-        self.sync_test_metrics(test_id)
+        # Analyze (analyze_test syncs metrics itself)
         analysis = self.analyze_test(test_id)
 
         return {
@@ -530,45 +577,45 @@ Keep it concise and actionable (3-5 bullet points)."""
 
     # Statistical helper methods
 
+    def _engagement_rates_by_variant(self, test_id: int) -> Dict[int, List[float]]:
+        """
+        Get non-negative engagement rates of a test's assignments, grouped by variant
+
+        Returns:
+            Dictionary mapping variant ID to its list of engagement rates
+        """
+        rates_by_variant = defaultdict(list)
+        for variant_id, engagement_rate in self.db.query(
+            TestAssignment.variant_id, TestAssignment.engagement_rate
+        ).filter(
+            TestAssignment.test_id == test_id,
+            TestAssignment.engagement_rate >= 0
+        ):
+            rates_by_variant[variant_id].append(engagement_rate)
+
+        return rates_by_variant
+
     def _two_sample_t_test(
         self,
-        variant_a: TestVariant,
-        variant_b: TestVariant,
+        rates_a: List[float],
+        rates_b: List[float],
         confidence_level: float
     ) -> Tuple[Optional[float], bool]:
         """
-        Perform two-sample t-test
+        Perform two-sample t-test on two variants' engagement rates
 
         Returns:
             (p_value, is_significant)
         """
-        # Get engagement rates for each variant
-        assignments_a = self.db.query(TestAssignment).filter(
-            TestAssignment.variant_id == variant_a.id
-        ).all()
-
-        assignments_b = self.db.query(TestAssignment).filter(
-            TestAssignment.variant_id == variant_b.id
-        ).all()
-
-        rates_a = [a.engagement_rate for a in assignments_a if a.engagement_rate >= 0]
-        rates_b = [a.engagement_rate for a in assignments_b if a.engagement_rate >= 0]
-
         if len(rates_a) < 2 or len(rates_b) < 2:
             return None, False
 
-        # Calculate means and standard deviations
-        mean_a = sum(rates_a) / len(rates_a)
-        mean_b = sum(rates_b) / len(rates_b)
-
-        std_a = self._calculate_std_dev(rates_a)
-        std_b = self._calculate_std_dev(rates_b)
-
-        n_a = len(rates_a)
-        n_b = len(rates_b)
+        # Calculate sample sizes, means and variances
+        n_a, mean_a, var_a = self._mean_and_variance(rates_a)
+        n_b, mean_b, var_b = self._mean_and_variance(rates_b)
 
         # Calculate pooled standard deviation
-        pooled_std = math.sqrt(((n_a - 1) * std_a**2 + (n_b - 1) * std_b**2) / (n_a + n_b - 2))
+        pooled_std = math.sqrt(((n_a - 1) * var_a + (n_b - 1) * var_b) / (n_a + n_b - 2))
 
         # Calculate t-statistic
         if pooled_std == 0:
@@ -620,17 +667,36 @@ Keep it concise and actionable (3-5 bullet points)."""
 
     def _calculate_std_dev(self, values: List[float]) -> float:
         """Calculate standard deviation"""
-        if len(values) < 2:
-            return 0.0
+        return math.sqrt(self._mean_and_variance(values)[2])
 
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / (len(values) - 1)
-        return math.sqrt(variance)
+    @staticmethod
+    def _mean_and_variance(values: List[float]) -> Tuple[int, float, float]:
+        """
+        Calculate sample size, mean and sample variance in a single pass
+
+        Uses Welford's online algorithm, which avoids a separate pass for
+        the mean and stays numerically stable for long runs of values.
+
+        Returns:
+            (count, mean, variance); variance is 0.0 for fewer than 2 values
+        """
+        count = 0
+        mean = 0.0
+        m2 = 0.0
+        for x in values:
+            count += 1
+            delta = x - mean
+            mean += delta / count
+            m2 += delta * (x - mean)
+
+        variance = m2 / (count - 1) if count > 1 else 0.0
+        return count, mean, variance
 
     def _determine_winner(
         self,
         variants: List[TestVariant],
         control: TestVariant,
+        rates_by_variant: Dict[int, List[float]],
         confidence_level: float
     ) -> Optional[TestVariant]:
         """
@@ -648,7 +714,9 @@ Keep it concise and actionable (3-5 bullet points)."""
 
         # Check if it's statistically significant
         p_value, is_significant = self._two_sample_t_test(
-            control, best_variant, confidence_level
+            rates_by_variant.get(control.id, []),
+            rates_by_variant.get(best_variant.id, []),
+            confidence_level
         )
 
         if is_significant:
@@ -7,7 +7,8 @@ Provides rich terminal-based visualizations for analytics data:
 - Insight displays
 """
 
-from typing import Dict, List
+from concurrent.futures import Future
+from typing import Dict, List, Union
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
@@ -22,12 +23,14 @@ class AnalyticsVisualizer:
     def __init__(self):
         self.console = Console()
 
-    def display_complete_dashboard(self, dashboard_data: Dict, insights: List[str] = None):
+    def display_complete_dashboard(self, dashboard_data: Dict,
+                                   insights: Union[List[str], Future] = None):
         """Display the complete analytics dashboard
 
         Args:
             dashboard_data: Complete dashboard data from AnalyticsEngine
-            insights: Optional AI-generated insights
+            insights: Optional AI-generated insights, or a Future resolving to them.
+                      A Future is only waited on once the other sections are drawn.
         """
         self.console.clear()
         self.console.print("\n")
@@ -51,6 +54,9 @@ class AnalyticsVisualizer:
         self._display_comment_activity(dashboard_data.get("comment_activity", {}))
         self.console.print("\n")
 
+        if isinstance(insights, Future):
+            insights = insights.result()
+
         if insights:
             self._display_insights(insights)
             self.console.print("\n")
@@ -0,0 +1,54 @@
+"""Configuration file loading and saving
+
+Uses the libyaml-backed C loader/dumper when PyYAML was built with it and
+falls back to the pure-Python implementations otherwise. Parsed files are
+memoized per (path, mtime) so repeated loads in one process skip the YAML
+parse until the file changes.
+"""
+
+import copy
+import os
+from functools import lru_cache
+from typing import Dict
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+
+@lru_cache(maxsize=8)
+def _parse_config(config_path: str, mtime_ns: int) -> Dict:
+    """Parse a config file; mtime_ns is only part of the cache key"""
+    # Binary mode lets libyaml do the UTF-8 decoding itself
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=_Loader)
+
+
+def load_config(config_path: str = 'config.yaml') -> Dict:
+    """
+    Load configuration from a YAML file
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Configuration dictionary (a private copy the caller may modify)
+    """
+    config_path = os.path.abspath(config_path)
+    config = _parse_config(config_path, os.stat(config_path).st_mtime_ns)
+    return copy.deepcopy(config)
+
+
+def save_config(config: Dict, config_path: str = 'config.yaml'):
+    """
+    Write configuration to a YAML file
+
+    Args:
+        config: Configuration dictionary
+        config_path: Path to the configuration file
+    """
+    with open(config_path, 'w') as f:
+        yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
@@ -11,12 +11,12 @@ Features:
 """
 
 import logging
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Tuple
 from datetime import datetime, timedelta, time as datetime_time
 from collections import defaultdict, Counter
 from sqlalchemy.orm import Session
 from sqlalchemy import func, desc
-import statistics
+import math
 
 logger = logging.getLogger(__name__)
 
@@ -80,34 +80,47 @@ class ContentStrategyAnalyzer:
         logger.info(f"Analyzing content performance for last {days_back} days")
 
         try:
-            from database.models import Post
+            from database.models import Post, Analytics
 
             cutoff_date = datetime.utcnow() - timedelta(days=days_back)
 
-            # Query posts with metrics
-            posts = self.db.query(Post).filter(
+            # Only the columns the analysis reads, with metrics joined in one
+            # query; a post without analytics counts as zero engagement
+            posts = self.db.query(
+                Post.content,
+                Post.created_at,
+                func.coalesce(Analytics.views, 0).label('views'),
+                func.coalesce(Analytics.likes, 0).label('likes'),
+                func.coalesce(Analytics.comments_count, 0).label('comments_count'),
+                func.coalesce(Analytics.shares, 0).label('shares')
+            ).outerjoin(
+                Analytics, Analytics.post_id == Post.id
+            ).filter(
                 Post.created_at >= cutoff_date,
                 Post.content.isnot(None)
-            ).all()
+            ).order_by(Post.id).all()
 
             if len(posts) < min_posts:
                 logger.warning(f"Not enough posts ({len(posts)}) for analysis")
                 return self._get_default_recommendations()
 
+            # Engagement is scored once per post and shared by every breakdown
+            scores = [self._calculate_engagement_score(post) for post in posts]
+
             # Analyze by content type
-            type_performance = self._analyze_by_content_type(posts)
+            type_performance = self._analyze_by_content_type(posts, scores)
 
             # Analyze by topic
-            topic_performance = self._analyze_by_topic(posts)
+            topic_performance = self._analyze_by_topic(posts, scores)
 
             # Analyze by time of day
-            time_performance = self._analyze_by_posting_time(posts)
+            time_performance = self._analyze_by_posting_time(posts, scores)
 
             # Analyze by day of week
-            day_performance = self._analyze_by_day_of_week(posts)
+            day_performance = self._analyze_by_day_of_week(posts, scores)
 
             # Analyze post length
-            length_analysis = self._analyze_post_length(posts)
+            length_analysis = self._analyze_post_length(posts, scores)
 
             # Overall metrics
             overall_metrics = self._calculate_overall_metrics(posts)
@@ -131,7 +144,7 @@ class ContentStrategyAnalyzer:
             logger.error(f"Error analyzing content performance: {e}")
             return self._get_default_recommendations()
 
-    def _analyze_by_content_type(self, posts: List) -> Dict:
+    def _analyze_by_content_type(self, posts: List, scores: List[float]) -> Dict:
         """Analyze performance by content type."""
         type_metrics = defaultdict(lambda: {
             'count': 0,
@@ -142,31 +155,21 @@ class ContentStrategyAnalyzer:
             'engagement_scores': []
         })
 
-        for post in posts:
+        for post, engagement in zip(posts, scores):
             content_type = self._classify_content_type(post.content)
-            engagement = self._calculate_engagement_score(post)
-
-            # Get metrics from Analytics relationship
-            if post.analytics:
-                views = post.analytics.views or 0
-                reactions = post.analytics.likes or 0
-                comments = post.analytics.comments_count or 0
-                shares = post.analytics.shares or 0
-            else:
-                views = reactions = comments = shares = 0
 
             type_metrics[content_type]['count'] += 1
-            type_metrics[content_type]['total_views'] += views
-            type_metrics[content_type]['total_reactions'] += reactions
-            type_metrics[content_type]['total_comments'] += comments
-            type_metrics[content_type]['total_shares'] += shares
+            type_metrics[content_type]['total_views'] += post.views
+            type_metrics[content_type]['total_reactions'] += post.likes
+            type_metrics[content_type]['total_comments'] += post.comments_count
+            type_metrics[content_type]['total_shares'] += post.shares
             type_metrics[content_type]['engagement_scores'].append(engagement)
 
         # Calculate averages and sort
         results = []
         for content_type, metrics in type_metrics.items():
             if metrics['count'] > 0:
-                avg_engagement = statistics.mean(metrics['engagement_scores'])
+                avg_engagement = self._mean(metrics['engagement_scores'])
                 results.append({
                     'type': content_type,
                     'count': metrics['count'],
@@ -195,22 +198,18 @@ class ContentStrategyAnalyzer:
 
         return 'other'
 
-    def _calculate_engagement_score(self, post) -> float:
-        """Calculate weighted engagement score for a post."""
-        # Get metrics from Analytics relationship
-        if post.analytics:
-            views = post.analytics.views or 0
-            reactions = post.analytics.likes or 0
-            comments = post.analytics.comments_count or 0
-            shares = post.analytics.shares or 0
-        else:
-            views = reactions = comments = shares = 0
+    @staticmethod
+    def _mean(values: List[float]) -> float:
+        """Mean of a non-empty list of scores"""
+        return math.fsum(values) / len(values)
 
+    def _calculate_engagement_score(self, post) -> float:
+        """Calculate weighted engagement score for a post row (metrics already coalesced to 0)."""
         # Weighted scoring: comments > shares > reactions > views
-        score = (views * 0.1) + (reactions * 1.0) + (comments * 3.0) + (shares * 2.0)
+        score = (post.views * 0.1) + (post.likes * 1.0) + (post.comments_count * 3.0) + (post.shares * 2.0)
         return score
 
-    def _analyze_by_topic(self, posts: List) -> Dict:
+    def _analyze_by_topic(self, posts: List, scores: List[float]) -> Dict:
         """Analyze performance by topic keywords."""
         # Get user's topics from config
         user_topics = self.user_topics or self.industry_topics.get(self.user_industry, [])
@@ -220,9 +219,8 @@ class ContentStrategyAnalyzer:
             'engagement_scores': []
         })
 
-        for post in posts:
+        for post, engagement in zip(posts, scores):
             content_lower = post.content.lower() if post.content else ''
-            engagement = self._calculate_engagement_score(post)
 
             # Check which topics appear in the post
             found_topic = False
@@ -240,7 +238,7 @@ class ContentStrategyAnalyzer:
         results = []
         for topic, metrics in topic_metrics.items():
             if metrics['count'] > 0 and metrics['engagement_scores']:
-                avg_engagement = statistics.mean(metrics['engagement_scores'])
+                avg_engagement = self._mean(metrics['engagement_scores'])
                 results.append({
                     'topic': topic,
                     'count': metrics['count'],
@@ -250,7 +248,7 @@ class ContentStrategyAnalyzer:
         results.sort(key=lambda x: x['avg_engagement'], reverse=True)
         return {'topics': results, 'best_topic': results[0]['topic'] if results else 'general'}
 
-    def _analyze_by_posting_time(self, posts: List) -> Dict:
+    def _analyze_by_posting_time(self, posts: List, scores: List[float]) -> Dict:
         """Analyze performance by time of day."""
         time_slots = {
             'early_morning': (5, 8),   # 5am-8am
@@ -266,12 +264,11 @@ class ContentStrategyAnalyzer:
             'engagement_scores': []
         })
 
-        for post in posts:
+        for post, engagement in zip(posts, scores):
             if not post.created_at:
                 continue
 
             hour = post.created_at.hour
-            engagement = self._calculate_engagement_score(post)
 
             # Find matching time slot
             for slot_name, (start, end) in time_slots.items():
@@ -284,7 +281,7 @@ class ContentStrategyAnalyzer:
         results = []
         for slot, metrics in slot_metrics.items():
             if metrics['count'] > 0 and metrics['engagement_scores']:
-                avg_engagement = statistics.mean(metrics['engagement_scores'])
+                avg_engagement = self._mean(metrics['engagement_scores'])
                 results.append({
                     'time_slot': slot,
                     'count': metrics['count'],
@@ -294,7 +291,7 @@ class ContentStrategyAnalyzer:
         results.sort(key=lambda x: x['avg_engagement'], reverse=True)
         return {'time_slots': results, 'best_time': results[0]['time_slot'] if results else 'morning'}
 
-    def _analyze_by_day_of_week(self, posts: List) -> Dict:
+    def _analyze_by_day_of_week(self, posts: List, scores: List[float]) -> Dict:
         """Analyze performance by day of week."""
         day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
 
@@ -303,12 +300,11 @@ class ContentStrategyAnalyzer:
             'engagement_scores': []
         })
 
-        for post in posts:
+        for post, engagement in zip(posts, scores):
             if not post.created_at:
                 continue
 
             day_name = day_names[post.created_at.weekday()]
-            engagement = self._calculate_engagement_score(post)
 
             day_metrics[day_name]['count'] += 1
             day_metrics[day_name]['engagement_scores'].append(engagement)
@@ -317,7 +313,7 @@ class ContentStrategyAnalyzer:
         results = []
         for day, metrics in day_metrics.items():
             if metrics['count'] > 0 and metrics['engagement_scores']:
-                avg_engagement = statistics.mean(metrics['engagement_scores'])
+                avg_engagement = self._mean(metrics['engagement_scores'])
                 results.append({
                     'day': day,
                     'count': metrics['count'],
@@ -327,7 +323,7 @@ class ContentStrategyAnalyzer:
         results.sort(key=lambda x: x['avg_engagement'], reverse=True)
         return {'days': results, 'best_day': results[0]['day'] if results else 'Tuesday'}
 
-    def _analyze_post_length(self, posts: List) -> Dict:
+    def _analyze_post_length(self, posts: List, scores: List[float]) -> Dict:
         """Analyze optimal post length."""
         length_buckets = {
             'short': (0, 500),      # < 500 chars
@@ -341,12 +337,11 @@ class ContentStrategyAnalyzer:
             'engagement_scores': []
         })
 
-        for post in posts:
+        for post, engagement in zip(posts, scores):
             if not post.content:
                 continue
 
             post_length = len(post.content)
-            engagement = self._calculate_engagement_score(post)
 
             # Find matching length bucket
             for bucket_name, (min_len, max_len) in length_buckets.items():
@@ -359,7 +354,7 @@ class ContentStrategyAnalyzer:
         results = []
         for bucket, metrics in length_metrics.items():
             if metrics['count'] > 0 and metrics['engagement_scores']:
-                avg_engagement = statistics.mean(metrics['engagement_scores'])
+                avg_engagement = self._mean(metrics['engagement_scores'])
                 results.append({
                     'length_category': bucket,
                     'count': metrics['count'],
@@ -377,11 +372,10 @@ class ContentStrategyAnalyzer:
         total_shares = 0
 
         for p in posts:
-            if p.analytics:
-                total_views += p.analytics.views or 0
-                total_reactions += p.analytics.likes or 0
-                total_comments += p.analytics.comments_count or 0
-                total_shares += p.analytics.shares or 0
+            total_views += p.views
+            total_reactions += p.likes
+            total_comments += p.comments_count
+            total_shares += p.shares
 
         count = len(posts)
 
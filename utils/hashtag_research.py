@@ -9,7 +9,10 @@ Features:
 - Historical performance tracking
 """
 
+import copy
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 from collections import Counter, defaultdict
@@ -32,6 +35,11 @@ class HashtagResearchEngine:
         self.user_industry = config.get('user_profile', {}).get('industry', 'Technology')
         self.user_topics = config.get('content', {}).get('topics', [])
 
+        # Successful AI responses, reused for near-identical requests until they
+        # expire: {key: (expires_at, value)}
+        self.ai_cache_ttl = config.get('content', {}).get('hashtag_cache_seconds', 3600)
+        self._ai_cache = {}
+
         # Industry-specific hashtag seeds
         self.industry_hashtags = {
             'Technology': [
@@ -65,6 +73,22 @@ class HashtagResearchEngine:
             ]
         }
 
+    @staticmethod
+    def _normalize_text(text: str) -> str:
+        """Case- and whitespace-insensitive form of a text, used in AI cache keys"""
+        return ' '.join(text.lower().split())
+
+    def _cache_get(self, key):
+        """Cached AI result for key, or None if missing or expired"""
+        entry = self._ai_cache.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            return None
+        return copy.deepcopy(entry[1])
+
+    def _cache_put(self, key, value):
+        """Cache an AI result under key for ai_cache_ttl seconds"""
+        self._ai_cache[key] = (time.monotonic() + self.ai_cache_ttl, copy.deepcopy(value))
+
     def get_industry_hashtags(self, industry: str = None) -> List[str]:
         """Get base hashtags for a specific industry."""
         industry = industry or self.user_industry
@@ -84,11 +108,20 @@ class HashtagResearchEngine:
         # Get base hashtags for the industry
         base_hashtags = self.get_industry_hashtags(industry)
 
-        # Research trending hashtags online using AI
-        online_trending = self._research_online_trends(industry, limit=limit//2)
+        if self.ai_client:
+            # The AI research call runs in a worker thread while the historical
+            # analysis queries the database here; the session stays on this thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                online_future = executor.submit(self._research_online_trends, industry, limit//2)
+
+                # Analyze historical performance from our database
+                historical_performance = self._analyze_historical_hashtag_performance(days_back)
 
-        # Analyze historical performance from our database
-        historical_performance = self._analyze_historical_hashtag_performance(days_back)
+                # Research trending hashtags online using AI
+                online_trending = online_future.result()
+        else:
+            online_trending = self._research_online_trends(industry, limit=limit//2)
+            historical_performance = self._analyze_historical_hashtag_performance(days_back)
 
         # Combine all sources
         trending = []
@@ -139,6 +172,12 @@ class HashtagResearchEngine:
             return []
 
         industry = industry or self.user_industry
+
+        cache_key = ('trends', self._normalize_text(industry), limit)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
         logger.info(f"Researching online trends for {industry} using AI")
 
         try:
@@ -166,15 +205,7 @@ Only return the JSON array, no other text."""
             response = self.ai_client.generate_text(prompt)
 
             # Parse the JSON response
-            import json
-            # Extract JSON from response (handle cases where AI adds explanation text)
-            response_text = response.strip()
-            if '```json' in response_text:
-                response_text = response_text.split('```json')[1].split('```')[0].strip()
-            elif '```' in response_text:
-                response_text = response_text.split('```')[1].split('```')[0].strip()
-
-            trending_data = json.loads(response_text)
+            trending_data = self._parse_json_response(response)
 
             # Format the results
             results = []
@@ -189,12 +220,26 @@ Only return the JSON array, no other text."""
                 })
 
             logger.info(f"Successfully researched {len(results)} trending hashtags online")
+            self._cache_put(cache_key, results)
             return results
 
         except Exception as e:
             logger.error(f"Error researching online trends: {e}")
             return []
 
+    @staticmethod
+    def _parse_json_response(response: str):
+        """Parse JSON from an AI response, ignoring any code fence or text around it"""
+        import json
+        # Extract JSON from response (handle cases where AI adds explanation text)
+        response_text = response.strip()
+        if '```json' in response_text:
+            response_text = response_text.split('```json')[1].split('```')[0].strip()
+        elif '```' in response_text:
+            response_text = response_text.split('```')[1].split('```')[0].strip()
+
+        return json.loads(response_text)
+
     def _analyze_historical_hashtag_performance(self, days_back: int = 30) -> List[Tuple[str, Dict]]:
         """
         Analyze hashtag performance from historical post data in database.
@@ -321,6 +366,12 @@ Only return the JSON array, no other text."""
                 trending_data = self.discover_trending_hashtags(limit=10)
                 trending = [h['hashtag'] for h in trending_data]
 
+            # Drafts that differ only in case or spacing reuse the same answer
+            cache_key = ('content', self._normalize_text(content), num_hashtags, tuple(trending))
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                return cached
+
             # Create AI prompt
             prompt = f"""Analyze this LinkedIn post and recommend {num_hashtags} optimal hashtags.
 
@@ -342,7 +393,7 @@ Requirements:
 Return ONLY a comma-separated list of hashtags without the # symbol.
 Example format: technology, ai, innovation, coding, python"""
 
-            response = self.ai_client.generate(prompt, max_tokens=100)
+            response = self.ai_client.generate_text(prompt, max_tokens=100)
 
             # Parse response
             hashtags = [h.strip().lower() for h in response.split(',')]
@@ -351,12 +402,100 @@ Example format: technology, ai, innovation, coding, python"""
             # Filter and validate
             hashtags = [h for h in hashtags if h and len(h) > 2 and len(h) < 30]
 
+            self._cache_put(cache_key, hashtags[:num_hashtags])
             return hashtags[:num_hashtags]
 
         except Exception as e:
             logger.error(f"Error generating hashtags with AI: {e}")
             return self.get_industry_hashtags()[:num_hashtags]
 
+    def generate_hashtags_for_contents(self,
+                                       contents: List[str],
+                                       num_hashtags: int = 5,
+                                       trending: List[str] = None) -> List[List[str]]:
+        """
+        Generate hashtags for several posts with a single AI request.
+
+        Args:
+            contents: The post contents to analyze
+            num_hashtags: Number of hashtags to generate per post
+            trending: Trending hashtags to give the AI as context
+
+        Returns:
+            One list of recommended hashtags (without # prefix) per post, in order
+        """
+        fallback = [self.get_industry_hashtags()[:num_hashtags] for _ in contents]
+        if not contents:
+            return []
+        if not self.ai_client:
+            logger.warning("No AI client available, using industry defaults")
+            return fallback
+
+        posts = "\n\n".join(f"Post {i}:\n{content}" for i, content in enumerate(contents, 1))
+
+        try:
+            prompt = f"""Analyze these {len(contents)} LinkedIn posts and recommend {num_hashtags} optimal hashtags for each.
+
+{posts}
+
+Industry: {self.user_industry}
+User topics: {', '.join(self.user_topics)}
+
+Currently trending hashtags in this industry: {', '.join(trending) if trending else 'N/A'}
+
+Requirements:
+1. Mix of popular and niche hashtags
+2. Relevant to each post's content and the industry
+3. Balance reach (popular) with targeting (specific)
+4. Use trending hashtags where appropriate
+5. Avoid overly generic hashtags
+
+Return ONLY a JSON array with one array of hashtags (without the # symbol) per post, in the same order as the posts.
+Example format for 2 posts: [["technology", "ai"], ["career", "leadership"]]"""
+
+            response = self.ai_client.generate_text(prompt, max_tokens=50 * len(contents))
+            per_post = self._parse_json_response(response)
+
+            if not isinstance(per_post, list) or len(per_post) != len(contents):
+                raise ValueError(f"expected a JSON array of {len(contents)} hashtag lists")
+
+            results = []
+            for hashtags in per_post:
+                # Same cleanup as the single-post path
+                hashtags = [str(h).strip().lower().replace('#', '') for h in hashtags]
+                hashtags = [h for h in hashtags if h and len(h) > 2 and len(h) < 30]
+                results.append(hashtags[:num_hashtags])
+            return results
+
+        except Exception as e:
+            logger.error(f"Error generating batched hashtags with AI: {e}")
+            return fallback
+
+    def _categorize_trending(self,
+                             trending_data: List[Dict],
+                             num_popular: int,
+                             num_trending: int,
+                             num_niche: int) -> Dict[str, List[str]]:
+        """Split trending hashtags into popular, trending and niche by trend score."""
+        popular = [h for h in trending_data if h['trend_score'] >= 70]
+        trending = [h for h in trending_data if 40 <= h['trend_score'] < 70]
+        niche = [h for h in trending_data if h['trend_score'] < 40]
+
+        return {
+            'popular': [h['hashtag'] for h in popular[:num_popular]],
+            'trending': [h['hashtag'] for h in trending[:num_trending]],
+            'niche': [h['hashtag'] for h in niche[:num_niche]]
+        }
+
+    @staticmethod
+    def _add_niche_hashtags(mix: Dict[str, List[str]], ai_hashtags: List[str], num_niche: int):
+        """Top up a mix's niche hashtags with AI suggestions not already in the mix."""
+        for hashtag in ai_hashtags:
+            if hashtag not in mix['popular'] and hashtag not in mix['trending']:
+                mix['niche'].append(hashtag)
+                if len(mix['niche']) >= num_niche:
+                    break
+
     def get_hashtag_mix(self,
                        content: str = None,
                        num_popular: int = 2,
@@ -368,32 +507,16 @@ Example format: technology, ai, innovation, coding, python"""
         Returns:
             Dict with 'popular', 'trending', and 'niche' hashtag lists
         """
-        result = {
-            'popular': [],
-            'trending': [],
-            'niche': []
-        }
-
         # Get trending hashtags
         trending_data = self.discover_trending_hashtags(limit=20)
 
         # Categorize hashtags by trend score
-        popular = [h for h in trending_data if h['trend_score'] >= 70]
-        trending = [h for h in trending_data if 40 <= h['trend_score'] < 70]
-        niche = [h for h in trending_data if h['trend_score'] < 40]
-
-        result['popular'] = [h['hashtag'] for h in popular[:num_popular]]
-        result['trending'] = [h['hashtag'] for h in trending[:num_trending]]
-        result['niche'] = [h['hashtag'] for h in niche[:num_niche]]
+        result = self._categorize_trending(trending_data, num_popular, num_trending, num_niche)
 
         # If we have content, use AI to enhance niche hashtags
         if content and self.ai_client and len(result['niche']) < num_niche:
             ai_hashtags = self.generate_hashtags_for_content(content, num_hashtags=num_niche)
-            for hashtag in ai_hashtags:
-                if hashtag not in result['popular'] and hashtag not in result['trending']:
-                    result['niche'].append(hashtag)
-                    if len(result['niche']) >= num_niche:
-                        break
+            self._add_niche_hashtags(result, ai_hashtags, num_niche)
 
         return result
 
@@ -408,13 +531,54 @@ Example format: technology, ai, innovation, coding, python"""
         # Get mixed hashtags
         mix = self.get_hashtag_mix(content, num_popular=2, num_trending=2, num_niche=1)
 
+        # Get trending data for context
+        trending_data = {h['hashtag']: h for h in self.discover_trending_hashtags(limit=20)}
+
+        return self._build_recommendations(mix, trending_data, max_hashtags)
+
+    def get_hashtag_recommendations_batch(self,
+                                          contents: List[str],
+                                          max_hashtags: int = 5,
+                                          batch_size: int = 20) -> List[Dict]:
+        """
+        Get hashtag recommendations for several posts at once.
+
+        Trending research runs once for the whole set, and the AI niche
+        suggestions come from one request per batch_size posts instead of one
+        per post.
+
+        Returns:
+            One recommendations dict (as from get_hashtag_recommendations) per post
+        """
+        if not contents:
+            return []
+
+        trending_list = self.discover_trending_hashtags(limit=20)
+        trending_data = {h['hashtag']: h for h in trending_list}
+        base_mix = self._categorize_trending(trending_list, num_popular=2, num_trending=2, num_niche=1)
+
+        ai_hashtags = [[] for _ in contents]
+        if self.ai_client and len(base_mix['niche']) < 1:
+            trending = [h['hashtag'] for h in trending_list[:10]]
+            for start in range(0, len(contents), batch_size):
+                ai_hashtags[start:start + batch_size] = self.generate_hashtags_for_contents(
+                    contents[start:start + batch_size], num_hashtags=1, trending=trending
+                )
+
+        results = []
+        for suggestions in ai_hashtags:
+            mix = {category: list(hashtags) for category, hashtags in base_mix.items()}
+            self._add_niche_hashtags(mix, suggestions, num_niche=1)
+            results.append(self._build_recommendations(mix, trending_data, max_hashtags))
+
+        return results
+
+    def _build_recommendations(self, mix: Dict[str, List[str]], trending_data: Dict, max_hashtags: int) -> Dict:
+        """Assemble the recommendations dict for one post from its hashtag mix."""
         # Flatten into single list
         all_hashtags = mix['popular'] + mix['trending'] + mix['niche']
         all_hashtags = all_hashtags[:max_hashtags]
 
-        # Get trending data for context
-        trending_data = {h['hashtag']: h for h in self.discover_trending_hashtags(limit=20)}
-
         recommendations = {
             'hashtags': all_hashtags,
             'formatted': ' '.join([f'#{h}' for h in all_hashtags]),
@@ -8,9 +8,11 @@ Scores potential connections 0-100 based on multiple factors:
 - Activity level (recent vs dormant)
 """
 
-from typing import Dict, List, Optional
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
+from sqlalchemy import case, func
 from database.models import Connection, Activity, Analytics
 
 
@@ -46,7 +48,8 @@ class LeadScoringEngine:
         self.target_titles = self.growth_config.get('target_titles', [])
         self.target_industries = self.growth_config.get('target_industries', [])
 
-    def score_prospect(self, prospect: Dict) -> Dict:
+    def score_prospect(self, prospect: Dict,
+                       engagement_counts: Optional[Dict[str, Tuple[int, int]]] = None) -> Dict:
         """
         Calculate comprehensive lead score for a prospect
 
@@ -63,13 +66,15 @@ class LeadScoringEngine:
                 - has_profile_photo: Boolean
                 - connection_count: Their total connections (if available)
                 - recent_activity: Last post/activity date (if available)
+            engagement_counts: Prefetched (likes, comments) by profile URL, as from
+                _get_engagement_counts; looked up for this prospect if omitted
 
         Returns:
             Dictionary with score breakdown and total score
         """
         scores = {
             'profile_quality': self._score_profile_quality(prospect),
-            'engagement_history': self._score_engagement_history(prospect),
+            'engagement_history': self._score_engagement_history(prospect, engagement_counts),
             'mutual_connections': self._score_mutual_connections(prospect),
             'company_targeting': self._score_company_targeting(prospect),
             'activity_level': self._score_activity_level(prospect)
@@ -143,7 +148,43 @@ class LeadScoringEngine:
 
         return min(score, 100.0)
 
-    def _score_engagement_history(self, prospect: Dict) -> float:
+    def _get_engagement_counts(self, profile_urls: Iterable[str],
+                               chunk_size: int = 500) -> Dict[str, Tuple[int, int]]:
+        """
+        Count likes and comments received from each profile in the last 30 days
+
+        One grouped query per chunk_size profiles, instead of two count
+        queries per profile.
+
+        Args:
+            profile_urls: Profile URLs to look up
+            chunk_size: Profiles per query (keeps the IN list bounded)
+
+        Returns:
+            Dictionary mapping profile URL to (likes, comments); profiles with
+            no engagement are absent
+        """
+        urls = list({url for url in profile_urls if url})
+        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
+
+        counts = {}
+        for start in range(0, len(urls), chunk_size):
+            rows = self.db.query(
+                Activity.target_id,
+                func.count(case((Activity.action_type == 'received_like', 1))),
+                func.count(case((Activity.action_type == 'received_comment', 1)))
+            ).filter(
+                Activity.action_type.in_(('received_like', 'received_comment')),
+                Activity.target_id.in_(urls[start:start + chunk_size]),
+                Activity.performed_at >= thirty_days_ago
+            ).group_by(Activity.target_id).all()
+
+            counts.update((url, (likes, comments)) for url, likes, comments in rows)
+
+        return counts
+
+    def _score_engagement_history(self, prospect: Dict,
+                                  engagement_counts: Optional[Dict[str, Tuple[int, int]]] = None) -> float:
         """
         Score based on past engagement with your content (0-100)
 
@@ -160,21 +201,9 @@ class LeadScoringEngine:
 
         # Check Activity table for engagement from this profile
         # Look for activities where target_id matches their profile
-        thirty_days_ago = datetime.utcnow() - timedelta(days=30)
-
-        # Count likes from this person
-        likes = self.db.query(Activity).filter(
-            Activity.action_type == 'received_like',
-            Activity.target_id == profile_url,
-            Activity.performed_at >= thirty_days_ago
-        ).count()
-
-        # Count comments from this person
-        comments = self.db.query(Activity).filter(
-            Activity.action_type == 'received_comment',
-            Activity.target_id == profile_url,
-            Activity.performed_at >= thirty_days_ago
-        ).count()
+        if engagement_counts is None:
+            engagement_counts = self._get_engagement_counts([profile_url])
+        likes, comments = engagement_counts.get(profile_url, (0, 0))
 
         # Scoring
         # Each like: +5 points (max 25)
@@ -361,8 +390,11 @@ class LeadScoringEngine:
         """
         scored_prospects = []
 
+        # Engagement history for every prospect comes from one grouped query
+        engagement_counts = self._get_engagement_counts(p.get('profile_url') for p in prospects)
+
         for prospect in prospects:
-            score_result = self.score_prospect(prospect)
+            score_result = self.score_prospect(prospect, engagement_counts)
             prospect_with_score = {
                 **prospect,
                 **score_result
@@ -388,15 +420,16 @@ class LeadScoringEngine:
             return {'error': 'No prospects provided'}
 
         scores = [p.get('total_score', 0) for p in prospects]
+        priority_counts = Counter(p.get('priority') for p in prospects)
 
         return {
             'total_prospects': len(prospects),
             'average_score': round(sum(scores) / len(scores), 1),
             'highest_score': max(scores),
             'lowest_score': min(scores),
-            'critical_priority': len([p for p in prospects if p.get('priority') == 'critical']),
-            'high_priority': len([p for p in prospects if p.get('priority') == 'high']),
-            'medium_priority': len([p for p in prospects if p.get('priority') == 'medium']),
-            'low_priority': len([p for p in prospects if p.get('priority') == 'low']),
-            'ignore': len([p for p in prospects if p.get('priority') == 'ignore'])
+            'critical_priority': priority_counts['critical'],
+            'high_priority': priority_counts['high'],
+            'medium_priority': priority_counts['medium'],
+            'low_priority': priority_counts['low'],
+            'ignore': priority_counts['ignore']
         }
@@ -8,6 +8,7 @@ Advanced features:
 - Response rate tracking and optimization
 """
 
+from collections import Counter
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
@@ -140,8 +141,8 @@ class MessageSequenceEngine:
         ).all()
 
         # Calculate response rates
-        responses_a = len([e for e in enrollments_a if e.responded])
-        responses_b = len([e for e in enrollments_b if e.responded])
+        responses_a = sum(1 for e in enrollments_a if e.responded)
+        responses_b = sum(1 for e in enrollments_b if e.responded)
 
         total_a = len(enrollments_a)
         total_b = len(enrollments_b)
@@ -150,8 +151,8 @@ class MessageSequenceEngine:
         response_rate_b = (responses_b / total_b * 100) if total_b > 0 else 0
 
         # Calculate completion rates
-        completed_a = len([e for e in enrollments_a if e.status == 'completed'])
-        completed_b = len([e for e in enrollments_b if e.status == 'completed'])
+        completed_a = sum(1 for e in enrollments_a if e.status == 'completed')
+        completed_b = sum(1 for e in enrollments_b if e.status == 'completed')
 
         completion_rate_a = (completed_a / total_a * 100) if total_a > 0 else 0
         completion_rate_b = (completed_b / total_b * 100) if total_b > 0 else 0
@@ -497,10 +498,11 @@ class MessageSequenceEngine:
             }
 
         # Calculate metrics
-        total_responses = len([e for e in enrollments if e.responded])
-        total_completed = len([e for e in enrollments if e.status == 'completed'])
-        total_active = len([e for e in enrollments if e.status == 'active'])
-        total_stopped = len([e for e in enrollments if e.status == 'stopped'])
+        status_counts = Counter(e.status for e in enrollments)
+        total_responses = sum(1 for e in enrollments if e.responded)
+        total_completed = status_counts['completed']
+        total_active = status_counts['active']
+        total_stopped = status_counts['stopped']
 
         response_rate = (total_responses / total_enrolled * 100)
         completion_rate = (total_completed / total_enrolled * 100)
@@ -516,12 +518,13 @@ class MessageSequenceEngine:
             avg_days_to_response = None
 
         # Get message-level stats
-        all_messages = self.db.query(SequenceMessage).join(SequenceEnrollment).filter(
+        message_rows = self.db.query(SequenceMessage.status).join(SequenceEnrollment).filter(
             SequenceEnrollment.sequence_id == sequence_id
         ).all()
+        message_counts = Counter(row.status for row in message_rows)
 
-        messages_sent = len([m for m in all_messages if m.status == 'sent'])
-        messages_failed = len([m for m in all_messages if m.status == 'failed'])
+        messages_sent = message_counts['sent']
+        messages_failed = message_counts['failed']
 
         return {
             'sequence_id': sequence_id,
@@ -1,7 +1,9 @@
 """Network Growth Automation Module"""
 
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from typing import List, Dict, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
@@ -590,9 +592,13 @@ Generate ONLY the message text, nothing else."""
         messages_sent = 0
         errors = 0
 
+        # AI message generation is slow and independent per enrollment, so run it
+        # concurrently up front; sending stays sequential on the single browser
+        prepared_messages = self._prepare_sequence_messages(due_enrollments)
+
         for enrollment in due_enrollments:
             try:
-                success = self._send_sequence_message(enrollment)
+                success = self._send_sequence_message(enrollment, prepared_messages.get(enrollment.id))
                 if success:
                     messages_sent += 1
                 else:
@@ -608,12 +614,63 @@ Generate ONLY the message text, nothing else."""
             'new_enrollments': new_enrollments
         }
 
-    def _send_sequence_message(self, enrollment: SequenceEnrollment) -> bool:
+    def _prepare_sequence_messages(self, enrollments: List[SequenceEnrollment]) -> Dict[int, str]:
+        """
+        Generate the next sequence message for several enrollments concurrently
+
+        Args:
+            enrollments: Enrollments with a message due
+
+        Returns:
+            Dictionary mapping enrollment ID to generated message content
+        """
+        # Only generate as many messages as can actually be sent: none without a
+        # LinkedIn client, and no more than the safety limits allow. Anything
+        # beyond that would be a paid AI call whose result is discarded
+        if not self.client:
+            return {}
+        remaining = self.safety_monitor.get_remaining_actions('message')
+
+        jobs = []
+        for enrollment in enrollments:
+            if len(jobs) >= remaining:
+                break
+            try:
+                steps = json.loads(enrollment.sequence.steps)
+                if enrollment.current_step < len(steps):
+                    # Plain snapshot, so worker threads never touch the session
+                    connection = enrollment.connection
+                    target = SimpleNamespace(name=connection.name, title=connection.title, company=connection.company)
+                    jobs.append((enrollment.id, target, steps[enrollment.current_step], enrollment.current_step))
+            except Exception:
+                # Malformed enrollment; _send_sequence_message reports it as a single error
+                continue
+
+        if len(jobs) < 2:
+            return {}
+
+        with ThreadPoolExecutor(max_workers=min(len(jobs), 4)) as executor:
+            futures = {
+                job[0]: executor.submit(
+                    self._generate_sequence_message, connection=job[1], step=job[2], step_number=job[3]
+                )
+                for job in jobs
+            }
+
+        # A failed generation is left to _send_sequence_message instead of discarding the rest
+        return {
+            enrollment_id: future.result()
+            for enrollment_id, future in futures.items()
+            if future.exception() is None
+        }
+
+    def _send_sequence_message(self, enrollment: SequenceEnrollment, message_content: str = None) -> bool:
         """
         Send the next message in a sequence
 
         Args:
             enrollment: SequenceEnrollment object
+            message_content: Pre-generated message for the current step (generated if omitted)
 
         Returns:
             Boolean indicating success
@@ -639,23 +696,25 @@ Generate ONLY the message text, nothing else."""
 
         step = steps[enrollment.current_step]
 
+        # Without a LinkedIn client nothing can be sent; leave the enrollment
+        # on this step rather than recording a message that never went out
+        if not self.client:
+            print(f"⚠️  LinkedIn client not initialized - message to {connection.name} not sent")
+            return False
+
         # Generate message
-        message_content = self._generate_sequence_message(
-            connection=connection,
-            step=step,
-            step_number=enrollment.current_step
-        )
+        if message_content is None:
+            message_content = self._generate_sequence_message(
+                connection=connection,
+                step=step,
+                step_number=enrollment.current_step
+            )
 
         try:
             # Send message via LinkedIn
-            if self.client:
-                success = self.client.send_message(connection.profile_url, message_content)
-                # Close any messaging overlay
-                self.client.close_messaging_overlay()
-            else:
-                # Client not initialized (testing mode)
-                print("⚠️  LinkedIn client not initialized - simulating message send")
-                success = True
+            success = self.client.send_message(connection.profile_url, message_content)
+            # Close any messaging overlay
+            self.client.close_messaging_overlay()
 
             # Create message record
             seq_message = SequenceMessage(
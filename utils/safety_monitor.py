@@ -3,8 +3,11 @@
 Monitors LinkedIn activity, enforces rate limits, and prevents account bans.
 """
 
+import copy
+import time
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from database.models import Activity, SafetyAlert
 
@@ -22,6 +25,9 @@ class SafetyMonitor:
         self.max_comments_per_day = self.config.get('max_comments_per_day', 15)
         self.max_connection_requests_per_day = self.config.get('max_connection_requests_per_day', 10)
 
+        # How long a computed safety status may be reused (seconds)
+        self.status_cache_ttl = self.config.get('status_cache_seconds', 10)
+
     def log_activity(self, action_type: str, target_type: str = None,
                      target_id: str = None, duration: float = 0,
                      success: bool = True, error: str = None) -> Activity:
@@ -53,6 +59,7 @@ class SafetyMonitor:
 
         self.db.add(activity)
         self.db.commit()
+        self._invalidate_status_cache()
 
         # Check if we should create alerts
         self._check_rate_limits()
@@ -72,17 +79,32 @@ class SafetyMonitor:
         }
         return risk_weights.get(action_type, 0.3)
 
-    def _check_rate_limits(self):
-        """Check if rate limits are being approached and create alerts"""
-        now = datetime.utcnow()
+    def _successful_activity_counts(self, action_type: str = None) -> Tuple[int, int, int]:
+        """Count successful activities in one query
 
-        # Check hourly limit
+        Returns:
+            (last hour, last 24 hours, last 24 hours of action_type)
+        """
+        now = datetime.utcnow()
         hour_ago = now - timedelta(hours=1)
-        hourly_count = self.db.query(Activity).filter(
-            Activity.performed_at >= hour_ago,
+        day_ago = now - timedelta(days=1)
+
+        hourly_count, daily_count, type_count = self.db.query(
+            func.count(case((Activity.performed_at >= hour_ago, 1))),
+            func.count(Activity.id),
+            func.count(case((Activity.action_type == action_type, 1)))
+        ).filter(
+            Activity.performed_at >= day_ago,
             Activity.success == True
-        ).count()
+        ).one()
 
+        return hourly_count, daily_count, type_count
+
+    def _check_rate_limits(self):
+        """Check if rate limits are being approached and create alerts"""
+        hourly_count, daily_count, _ = self._successful_activity_counts()
+
+        # Check hourly limit
         if hourly_count >= self.max_actions_per_hour * 0.8:  # 80% threshold
             self._create_alert(
                 alert_type='rate_limit_hourly',
@@ -93,12 +115,6 @@ class SafetyMonitor:
             )
 
         # Check daily limit
-        day_ago = now - timedelta(days=1)
-        daily_count = self.db.query(Activity).filter(
-            Activity.performed_at >= day_ago,
-            Activity.success == True
-        ).count()
-
         if daily_count >= self.max_actions_per_day * 0.8:  # 80% threshold
             self._create_alert(
                 alert_type='rate_limit_daily',
@@ -132,6 +148,7 @@ class SafetyMonitor:
 
         self.db.add(alert)
         self.db.commit()
+        self._invalidate_status_cache()
 
     def check_action_allowed(self, action_type: str) -> Dict:
         """Check if an action is allowed based on current limits
@@ -139,15 +156,9 @@ class SafetyMonitor:
         Returns:
             Dict with 'allowed' bool and 'reason' string
         """
-        now = datetime.utcnow()
+        hourly_count, daily_count, type_count = self._successful_activity_counts(action_type)
 
         # Check hourly limit
-        hour_ago = now - timedelta(hours=1)
-        hourly_count = self.db.query(Activity).filter(
-            Activity.performed_at >= hour_ago,
-            Activity.success == True
-        ).count()
-
         if hourly_count >= self.max_actions_per_hour:
             return {
                 'allowed': False,
@@ -156,12 +167,6 @@ class SafetyMonitor:
             }
 
         # Check daily limit
-        day_ago = now - timedelta(days=1)
-        daily_count = self.db.query(Activity).filter(
-            Activity.performed_at >= day_ago,
-            Activity.success == True
-        ).count()
-
         if daily_count >= self.max_actions_per_day:
             return {
                 'allowed': False,
@@ -171,11 +176,7 @@ class SafetyMonitor:
 
         # Check action-specific limits
         if action_type == 'post':
-            posts_today = self.db.query(Activity).filter(
-                Activity.performed_at >= day_ago,
-                Activity.action_type == 'post',
-                Activity.success == True
-            ).count()
+            posts_today = type_count
 
             if posts_today >= self.max_posts_per_day:
                 return {
@@ -185,11 +186,7 @@ class SafetyMonitor:
                 }
 
         elif action_type == 'comment':
-            comments_today = self.db.query(Activity).filter(
-                Activity.performed_at >= day_ago,
-                Activity.action_type == 'comment',
-                Activity.success == True
-            ).count()
+            comments_today = type_count
 
             if comments_today >= self.max_comments_per_day:
                 return {
@@ -199,11 +196,7 @@ class SafetyMonitor:
                 }
 
         elif action_type == 'connection_request':
-            requests_today = self.db.query(Activity).filter(
-                Activity.performed_at >= day_ago,
-                Activity.action_type == 'connection_request',
-                Activity.success == True
-            ).count()
+            requests_today = type_count
 
             if requests_today >= self.max_connection_requests_per_day:
                 return {
@@ -214,8 +207,54 @@ class SafetyMonitor:
 
         return {'allowed': True, 'reason': 'Action permitted'}
 
+    def get_remaining_actions(self, action_type: str) -> int:
+        """Number of further action_type actions check_action_allowed would permit right now
+
+        Returns:
+            Remaining allowance under the hourly, daily and action-specific limits (0 if blocked)
+        """
+        hourly_count, daily_count, type_count = self._successful_activity_counts(action_type)
+
+        remaining = min(self.max_actions_per_hour - hourly_count, self.max_actions_per_day - daily_count)
+
+        type_limits = {
+            'post': self.max_posts_per_day,
+            'comment': self.max_comments_per_day,
+            'connection_request': self.max_connection_requests_per_day
+        }
+        if action_type in type_limits:
+            remaining = min(remaining, type_limits[action_type] - type_count)
+
+        return max(0, remaining)
+
     def get_safety_status(self) -> Dict:
-        """Get current safety status and metrics"""
+        """Get current safety status and metrics
+
+        The result is cached on the database session for status_cache_ttl
+        seconds. Logging an activity or changing an alert through any
+        SafetyMonitor sharing the session clears the cache.
+        """
+        cache = self.db.info.setdefault('safety_status_cache', {})
+        # Status depends only on the limits, so monitors with equal limits share entries
+        key = (
+            self.max_actions_per_hour, self.max_actions_per_day, self.max_posts_per_day,
+            self.max_comments_per_day, self.max_connection_requests_per_day
+        )
+
+        cached = cache.get(key)
+        if cached and time.monotonic() - cached[0] < self.status_cache_ttl:
+            return copy.deepcopy(cached[1])
+
+        status = self._compute_safety_status()
+        cache[key] = (time.monotonic(), status)
+        return copy.deepcopy(status)
+
+    def _invalidate_status_cache(self):
+        """Drop cached safety statuses for this session"""
+        self.db.info.pop('safety_status_cache', None)
+
+    def _compute_safety_status(self) -> Dict:
+        """Query current safety status and metrics"""
         now = datetime.utcnow()
         hour_ago = now - timedelta(hours=1)
         day_ago = now - timedelta(days=1)
@@ -303,6 +342,7 @@ class SafetyMonitor:
             alert.acknowledged = True
             alert.acknowledged_at = datetime.utcnow()
             self.db.commit()
+            self._invalidate_status_cache()
 
     def resolve_alert(self, alert_id: int):
         """Resolve a safety alert"""
@@ -311,3 +351,4 @@ class SafetyMonitor:
             alert.resolved = True
             alert.resolved_at = datetime.utcnow()
             self.db.commit()
+            self._invalidate_status_cache()
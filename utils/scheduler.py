@@ -3,7 +3,8 @@
 import time
 from datetime import datetime, timedelta
 from typing import List, Optional
-from database import Database, Post
+from database import Post
+from database.session import get_database
 from linkedin import LinkedInClient, PostManager
 
 
@@ -18,7 +19,7 @@ class Scheduler:
             config: Configuration dictionary
         """
         self.config = config
-        self.db = Database(config)
+        self.db = get_database(config)
 
     def get_scheduled_posts(self) -> List[Post]:
         """